@@ -0,0 +1,29 @@
+"""
+Build the optional Cython payoff kernel in place:
+
+    cd api && python _build_payoff.py
+
+Needs Cython and a C compiler. Without the built _payoff module,
+strategies.py uses the Numba kernel from bs_kernel.
+"""
+
+import sys
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+
+if sys.platform == "win32":
+    COMPILE_ARGS = ["/O2", "/fp:fast"]
+else:
+    COMPILE_ARGS = ["-O3", "-march=native", "-ffast-math"]
+
+
+setup(
+    name="payoff-kernel",
+    ext_modules=cythonize(
+        [Extension("_payoff", ["_payoff.pyx"], extra_compile_args=COMPILE_ARGS)],
+        language_level=3,
+    ),
+    script_args=["build_ext", "--inplace"],
+)
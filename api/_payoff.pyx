@@ -0,0 +1,33 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Ahead-of-time payoff kernel (optional)
+Same contract as bs_kernel.payoff_vec, compiled at install time by
+_build_payoff.py so there is no JIT step at import or first call
+"""
+
+from cython cimport floating
+
+
+def payoff_batch(const floating[::1] S, const floating[::1] strikes,
+                 const floating[::1] premiums, const signed char[::1] type_sign,
+                 const signed char[::1] sign, const int[::1] qty, floating[::1] out):
+    """
+    Summed expiration payoff of all option legs (x100 x contracts) over an
+    array of stock prices, written into out. type_sign is +1 for calls and
+    -1 for puts; sums accumulate in double.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n_prices = S.shape[0]
+    cdef Py_ssize_t n_legs = strikes.shape[0]
+    cdef double s, total, intrinsic
+    
+    with nogil:
+        for i in range(n_prices):
+            s = S[i]
+            total = 0.0
+            for j in range(n_legs):
+                intrinsic = type_sign[j] * (s - strikes[j])
+                if intrinsic < 0.0:
+                    intrinsic = 0.0
+                total += sign[j] * qty[j] * (intrinsic - premiums[j])
+            out[i] = total * 100.0
@@ -0,0 +1,533 @@
+"""
+Strategy factory functions and the ALL_STRATEGIES catalog
+Loaded on first use through strategies.__getattr__; import names from
+strategies, not from here
+"""
+
+from functools import partial
+from typing import Callable, Dict
+
+from strategies import (
+    OptionsStrategy, MarketParams, DEFAULT_MARKET_PARAMS, StrategyBank,
+    build_strategy, strategy_grid
+)
+
+
+# Names strategies.__getattr__ serves from this module
+__all__ = [
+    'covered_call', 'covered_put', 'protective_put', 'protective_call',
+    'bull_call_spread', 'bear_put_spread', 'bull_put_spread', 'bear_call_spread',
+    'long_straddle', 'short_straddle', 'long_strangle', 'short_strangle',
+    'long_call_butterfly', 'long_put_butterfly', 'short_call_butterfly',
+    'iron_butterfly', 'iron_condor', 'iron_condor_grid', 'long_call_condor',
+    'long_put_condor', 'call_ratio_spread', 'put_ratio_spread', 'call_ratio_backspread',
+    'call_calendar_spread', 'put_calendar_spread', 'diagonal_call_spread',
+    'diagonal_put_spread', 'collar', 'reverse_collar', 'long_strip', 'long_strap',
+    'short_strip', 'short_strap', 'jade_lizard', 'seagull', 'box_spread', 'conversion',
+    'reversal', 'poor_mans_covered_call', 'wheel_put_phase', 'wheel_call_phase',
+    'zebra_spread', 'call_ladder', 'put_ladder', 'synthetic_long', 'synthetic_short',
+    'make_factories', 'ALL_STRATEGIES',
+]
+
+
+# ============================================================================
+# BASIC STRATEGIES (4)
+# ============================================================================
+
+def covered_call(stock_price: float, call_strike: float, call_premium: float,
+                 market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Covered Call - Long stock + Short call"""
+    return build_strategy("Covered Call", stock_price, call_strike, call_premium,
+                          market_params=market_params)
+
+
+def covered_put(stock_price: float, put_strike: float, put_premium: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Covered Put - Short stock + Short put"""
+    return build_strategy("Covered Put", stock_price, put_strike, put_premium,
+                          market_params=market_params)
+
+
+def protective_put(stock_price: float, put_strike: float, put_premium: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Protective Put - Long stock + Long put"""
+    return build_strategy("Protective Put", stock_price, put_strike, put_premium,
+                          market_params=market_params)
+
+
+def protective_call(stock_price: float, call_strike: float, call_premium: float,
+                    market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Protective Call - Short stock + Long call"""
+    return build_strategy("Protective Call", stock_price, call_strike, call_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# VERTICAL SPREADS (4)
+# ============================================================================
+
+def bull_call_spread(lower_strike: float, upper_strike: float,
+                     lower_premium: float, upper_premium: float,
+                     market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Bull Call Spread - Long lower call + Short upper call"""
+    return build_strategy("Bull Call Spread", lower_strike, upper_strike, lower_premium,
+                          upper_premium,
+                          market_params=market_params)
+
+
+def bear_put_spread(lower_strike: float, upper_strike: float,
+                    lower_premium: float, upper_premium: float,
+                    market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Bear Put Spread - Long upper put + Short lower put"""
+    return build_strategy("Bear Put Spread", lower_strike, upper_strike, lower_premium,
+                          upper_premium,
+                          market_params=market_params)
+
+
+def bull_put_spread(lower_strike: float, upper_strike: float,
+                    lower_premium: float, upper_premium: float,
+                    market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Bull Put Spread - Short upper put + Long lower put"""
+    return build_strategy("Bull Put Spread", lower_strike, upper_strike, lower_premium,
+                          upper_premium,
+                          market_params=market_params)
+
+
+def bear_call_spread(lower_strike: float, upper_strike: float,
+                     lower_premium: float, upper_premium: float,
+                     market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Bear Call Spread - Short lower call + Long upper call"""
+    return build_strategy("Bear Call Spread", lower_strike, upper_strike, lower_premium,
+                          upper_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# STRADDLES & STRANGLES (4)
+# ============================================================================
+
+def long_straddle(strike: float, call_premium: float, put_premium: float,
+                  market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Straddle - Long call + Long put (same strike)"""
+    return build_strategy("Long Straddle", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def short_straddle(strike: float, call_premium: float, put_premium: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Short Straddle - Short call + Short put (same strike)"""
+    return build_strategy("Short Straddle", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def long_strangle(call_strike: float, put_strike: float,
+                  call_premium: float, put_premium: float,
+                  market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Strangle - Long OTM call + Long OTM put"""
+    return build_strategy("Long Strangle", call_strike, put_strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def short_strangle(call_strike: float, put_strike: float,
+                   call_premium: float, put_premium: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Short Strangle - Short OTM call + Short OTM put"""
+    return build_strategy("Short Strangle", call_strike, put_strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# BUTTERFLIES (4)
+# ============================================================================
+
+def long_call_butterfly(lower_strike: float, middle_strike: float, upper_strike: float,
+                        lower_premium: float, middle_premium: float, upper_premium: float,
+                        market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Call Butterfly"""
+    return build_strategy("Long Call Butterfly", lower_strike, middle_strike, upper_strike,
+                          lower_premium, middle_premium, upper_premium,
+                          market_params=market_params)
+
+
+def long_put_butterfly(lower_strike: float, middle_strike: float, upper_strike: float,
+                       lower_premium: float, middle_premium: float, upper_premium: float,
+                       market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Put Butterfly"""
+    return build_strategy("Long Put Butterfly", lower_strike, middle_strike, upper_strike,
+                          lower_premium, middle_premium, upper_premium,
+                          market_params=market_params)
+
+
+def short_call_butterfly(lower_strike: float, middle_strike: float, upper_strike: float,
+                         lower_premium: float, middle_premium: float, upper_premium: float,
+                         market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Short Call Butterfly"""
+    return build_strategy("Short Call Butterfly", lower_strike, middle_strike, upper_strike,
+                          lower_premium, middle_premium, upper_premium,
+                          market_params=market_params)
+
+
+def iron_butterfly(atm_strike: float, lower_strike: float, upper_strike: float,
+                   atm_call_premium: float, atm_put_premium: float,
+                   lower_put_premium: float, upper_call_premium: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Iron Butterfly"""
+    return build_strategy("Iron Butterfly", atm_strike, lower_strike, upper_strike,
+                          atm_call_premium, atm_put_premium, lower_put_premium,
+                          upper_call_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# CONDORS (3)
+# ============================================================================
+
+def iron_condor(put_lower: float, put_upper: float, call_lower: float, call_upper: float,
+                put_lower_prem: float, put_upper_prem: float,
+                call_lower_prem: float, call_upper_prem: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Iron Condor"""
+    return build_strategy("Iron Condor", put_lower, put_upper, call_lower, call_upper,
+                          put_lower_prem, put_upper_prem, call_lower_prem, call_upper_prem,
+                          market_params=market_params)
+
+
+def iron_condor_grid(put_lower, put_upper, call_lower, call_upper,
+                     put_lower_prem, put_upper_prem,
+                     call_lower_prem, call_upper_prem) -> StrategyBank:
+    """Iron Condors over broadcast arrays of strikes and premiums (sweeps)"""
+    return strategy_grid("Iron Condor", put_lower, put_upper, call_lower, call_upper,
+                         put_lower_prem, put_upper_prem, call_lower_prem, call_upper_prem)
+
+
+def long_call_condor(s1: float, s2: float, s3: float, s4: float,
+                     p1: float, p2: float, p3: float, p4: float,
+                     market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Call Condor"""
+    return build_strategy("Long Call Condor", s1, s2, s3, s4, p1, p2, p3, p4,
+                          market_params=market_params)
+
+
+def long_put_condor(s1: float, s2: float, s3: float, s4: float,
+                    p1: float, p2: float, p3: float, p4: float,
+                    market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Put Condor"""
+    return build_strategy("Long Put Condor", s1, s2, s3, s4, p1, p2, p3, p4,
+                          market_params=market_params)
+
+
+# ============================================================================
+# RATIO SPREADS (3)
+# ============================================================================
+
+def call_ratio_spread(lower_strike: float, upper_strike: float,
+                      lower_premium: float, upper_premium: float,
+                      ratio: int = 2,
+                      market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Call Ratio Spread - Long 1 lower + Short N upper"""
+    return build_strategy("Call Ratio Spread", lower_strike, upper_strike, lower_premium,
+                          upper_premium, ratio,
+                          market_params=market_params)
+
+
+def put_ratio_spread(lower_strike: float, upper_strike: float,
+                     lower_premium: float, upper_premium: float,
+                     ratio: int = 2,
+                     market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Put Ratio Spread - Long 1 upper + Short N lower"""
+    return build_strategy("Put Ratio Spread", lower_strike, upper_strike, lower_premium,
+                          upper_premium, ratio,
+                          market_params=market_params)
+
+
+def call_ratio_backspread(lower_strike: float, upper_strike: float,
+                          lower_premium: float, upper_premium: float,
+                          ratio: int = 2,
+                          market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Call Ratio Backspread - Short 1 lower + Long N upper"""
+    return build_strategy("Call Ratio Backspread", lower_strike, upper_strike, lower_premium,
+                          upper_premium, ratio,
+                          market_params=market_params)
+
+
+# ============================================================================
+# CALENDAR & DIAGONAL SPREADS (4)
+# ============================================================================
+
+def call_calendar_spread(strike: float, near_premium: float, far_premium: float,
+                         market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Call Calendar Spread - Sell near, buy far (same strike)"""
+    return build_strategy("Call Calendar Spread", strike, near_premium, far_premium,
+                          market_params=market_params)
+
+
+def put_calendar_spread(strike: float, near_premium: float, far_premium: float,
+                        market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Put Calendar Spread - Sell near, buy far (same strike)"""
+    return build_strategy("Put Calendar Spread", strike, near_premium, far_premium,
+                          market_params=market_params)
+
+
+def diagonal_call_spread(near_strike: float, far_strike: float,
+                         near_premium: float, far_premium: float,
+                         market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Diagonal Call Spread"""
+    return build_strategy("Diagonal Call Spread", near_strike, far_strike, near_premium,
+                          far_premium,
+                          market_params=market_params)
+
+
+def diagonal_put_spread(near_strike: float, far_strike: float,
+                        near_premium: float, far_premium: float,
+                        market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Diagonal Put Spread"""
+    return build_strategy("Diagonal Put Spread", near_strike, far_strike, near_premium,
+                          far_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# COLLARS (2)
+# ============================================================================
+
+def collar(stock_price: float, put_strike: float, call_strike: float,
+          put_premium: float, call_premium: float,
+          market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Collar - Long stock + Long put + Short call"""
+    return build_strategy("Collar", stock_price, put_strike, call_strike, put_premium,
+                          call_premium,
+                          market_params=market_params)
+
+
+def reverse_collar(stock_price: float, put_strike: float, call_strike: float,
+                   put_premium: float, call_premium: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Reverse Collar - Short stock + Short put + Long call"""
+    return build_strategy("Reverse Collar", stock_price, put_strike, call_strike, put_premium,
+                          call_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# STRIP & STRAP (4)
+# ============================================================================
+
+def long_strip(strike: float, call_premium: float, put_premium: float,
+               market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Strip - 1 call + 2 puts (bearish straddle)"""
+    return build_strategy("Long Strip", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def long_strap(strike: float, call_premium: float, put_premium: float,
+               market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Long Strap - 2 calls + 1 put (bullish straddle)"""
+    return build_strategy("Long Strap", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def short_strip(strike: float, call_premium: float, put_premium: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Short Strip"""
+    return build_strategy("Short Strip", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def short_strap(strike: float, call_premium: float, put_premium: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Short Strap"""
+    return build_strategy("Short Strap", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# ADVANCED STRATEGIES (10+)
+# ============================================================================
+
+def jade_lizard(put_strike: float, call_lower: float, call_upper: float,
+                put_prem: float, call_lower_prem: float, call_upper_prem: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Jade Lizard - Short put + Bear call spread"""
+    return build_strategy("Jade Lizard", put_strike, call_lower, call_upper, put_prem,
+                          call_lower_prem, call_upper_prem,
+                          market_params=market_params)
+
+
+def seagull(stock_price: float, put_strike: float, call_lower: float, call_upper: float,
+            put_prem: float, call_lower_prem: float, call_upper_prem: float,
+            market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Seagull - Long stock + Long put + Bear call spread"""
+    return build_strategy("Seagull", stock_price, put_strike, call_lower, call_upper, put_prem,
+                          call_lower_prem, call_upper_prem,
+                          market_params=market_params)
+
+
+def box_spread(lower_strike: float, upper_strike: float,
+               call_lower_prem: float, call_upper_prem: float,
+               put_lower_prem: float, put_upper_prem: float,
+               market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Box Spread - Bull call + Bear put"""
+    return build_strategy("Box Spread", lower_strike, upper_strike, call_lower_prem,
+                          call_upper_prem, put_lower_prem, put_upper_prem,
+                          market_params=market_params)
+
+
+def conversion(stock_price: float, strike: float, call_prem: float, put_prem: float,
+               market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Conversion - Long stock + Long put + Short call"""
+    return build_strategy("Conversion", stock_price, strike, call_prem, put_prem,
+                          market_params=market_params)
+
+
+def reversal(stock_price: float, strike: float, call_prem: float, put_prem: float,
+             market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Reversal - Short stock + Short put + Long call"""
+    return build_strategy("Reversal", stock_price, strike, call_prem, put_prem,
+                          market_params=market_params)
+
+
+def poor_mans_covered_call(deep_itm_strike: float, otm_strike: float,
+                           deep_itm_prem: float, otm_prem: float,
+                           market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Poor Man's Covered Call - Deep ITM LEAPS + Short OTM call"""
+    return build_strategy("Poor Man's Covered Call", deep_itm_strike, otm_strike,
+                          deep_itm_prem, otm_prem,
+                          market_params=market_params)
+
+
+def wheel_put_phase(put_strike: float, put_premium: float,
+                    market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Wheel Strategy - Put Phase (cash-secured put)"""
+    return build_strategy("Wheel Strategy (Put)", put_strike, put_premium,
+                          market_params=market_params)
+
+
+def wheel_call_phase(stock_price: float, call_strike: float, call_premium: float,
+                     market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Wheel Strategy - Call Phase (covered call after assignment)"""
+    return build_strategy("Wheel Strategy (Call)", stock_price, call_strike, call_premium,
+                          market_params=market_params)
+
+
+def zebra_spread(deep_itm_strike: float, otm_strike: float,
+                deep_itm_prem: float, otm_prem: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """ZEBRA - Long 1 deep ITM call + Short 2 OTM calls"""
+    return build_strategy("ZEBRA Spread", deep_itm_strike, otm_strike, deep_itm_prem, otm_prem,
+                          market_params=market_params)
+
+
+def call_ladder(s1: float, s2: float, s3: float,
+                p1: float, p2: float, p3: float,
+                market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Call Ladder - Long 1 low + Short 1 mid + Short 1 high"""
+    return build_strategy("Call Ladder", s1, s2, s3, p1, p2, p3, market_params=market_params)
+
+
+def put_ladder(s1: float, s2: float, s3: float,
+               p1: float, p2: float, p3: float,
+               market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Put Ladder - Long 1 high + Short 1 mid + Short 1 low"""
+    return build_strategy("Put Ladder", s1, s2, s3, p1, p2, p3, market_params=market_params)
+
+
+# ============================================================================
+# SYNTHETIC POSITIONS (2)
+# ============================================================================
+
+def synthetic_long(strike: float, call_premium: float, put_premium: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Synthetic Long Stock - Long call + Short put"""
+    return build_strategy("Synthetic Long Stock", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+def synthetic_short(strike: float, call_premium: float, put_premium: float,
+                    market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """Synthetic Short Stock - Short call + Long put"""
+    return build_strategy("Synthetic Short Stock", strike, call_premium, put_premium,
+                          market_params=market_params)
+
+
+# ============================================================================
+# STRATEGY CATALOG
+# ============================================================================
+
+ALL_STRATEGIES = {
+    # Basic (4)
+    "Covered Call": covered_call,
+    "Covered Put": covered_put,
+    "Protective Put": protective_put,
+    "Protective Call": protective_call,
+    
+    # Vertical Spreads (4)
+    "Bull Call Spread": bull_call_spread,
+    "Bear Put Spread": bear_put_spread,
+    "Bull Put Spread": bull_put_spread,
+    "Bear Call Spread": bear_call_spread,
+    
+    # Straddles & Strangles (4)
+    "Long Straddle": long_straddle,
+    "Short Straddle": short_straddle,
+    "Long Strangle": long_strangle,
+    "Short Strangle": short_strangle,
+    
+    # Butterflies (4)
+    "Long Call Butterfly": long_call_butterfly,
+    "Long Put Butterfly": long_put_butterfly,
+    "Short Call Butterfly": short_call_butterfly,
+    "Iron Butterfly": iron_butterfly,
+    
+    # Condors (3)
+    "Iron Condor": iron_condor,
+    "Long Call Condor": long_call_condor,
+    "Long Put Condor": long_put_condor,
+    
+    # Ratio Spreads (3)
+    "Call Ratio Spread": call_ratio_spread,
+    "Put Ratio Spread": put_ratio_spread,
+    "Call Ratio Backspread": call_ratio_backspread,
+    
+    # Calendar & Diagonal (4)
+    "Call Calendar Spread": call_calendar_spread,
+    "Put Calendar Spread": put_calendar_spread,
+    "Diagonal Call Spread": diagonal_call_spread,
+    "Diagonal Put Spread": diagonal_put_spread,
+    
+    # Collars (2)
+    "Collar": collar,
+    "Reverse Collar": reverse_collar,
+    
+    # Strip & Strap (4)
+    "Long Strip": long_strip,
+    "Long Strap": long_strap,
+    "Short Strip": short_strip,
+    "Short Strap": short_strap,
+    
+    # Advanced (10)
+    "Jade Lizard": jade_lizard,
+    "Seagull": seagull,
+    "Box Spread": box_spread,
+    "Conversion": conversion,
+    "Reversal": reversal,
+    "Poor Man's Covered Call": poor_mans_covered_call,
+    "Wheel Strategy (Put)": wheel_put_phase,
+    "Wheel Strategy (Call)": wheel_call_phase,
+    "ZEBRA Spread": zebra_spread,
+    "Call Ladder": call_ladder,
+    "Put Ladder": put_ladder,
+    
+    # Synthetic (2)
+    "Synthetic Long Stock": synthetic_long,
+    "Synthetic Short Stock": synthetic_short,
+}
+
+# Total: 50+ strategies
+
+
+def make_factories(market_params: MarketParams) -> Dict[str, Callable[..., OptionsStrategy]]:
+    """
+    ALL_STRATEGIES with market_params pre-bound, for loops (backtests,
+    sweeps) that build many strategies under the same market conditions.
+    """
+    return {name: partial(fn, market_params=market_params) for name, fn in ALL_STRATEGIES.items()}
@@ -0,0 +1,241 @@
+"""
+Compiled Black-Scholes kernel
+Price + all Greeks in a single Numba pass, scalar and vectorized over S
+"""
+
+import math
+import os
+import tempfile
+from typing import NamedTuple
+
+# Serverless deploys ship a read-only source tree: keep Numba's on-disk cache
+# somewhere writable, otherwise cache=True fails at import. Image builds can
+# fill the cache ahead of time by running `python -c "import bs_kernel"`
+# with NUMBA_CACHE_DIR set to a directory that persists into the runtime
+# image; warmup() then only loads compiled code.
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "numba_cache"))
+
+import numpy as np
+from numba import njit, prange
+
+
+RSQRT2PI = 0.3989422804014327  # 1/sqrt(2*pi)
+RSQRT2 = 0.7071067811865476    # 1/sqrt(2)
+
+
+# ============================================================================
+# PRICING CONTEXT
+# ============================================================================
+
+class BSContext(NamedTuple):
+    """
+    Per-analysis constants shared by every leg (T, r, q, sigma are fixed
+    for a strategy, only S and K vary). A NamedTuple so Numba can take it
+    directly as a kernel argument.
+    """
+    T: float
+    r: float
+    q: float
+    sigma: float
+    sqrtT: float
+    sig_sqrtT: float
+    disc_r: float     # exp(-r*T)
+    disc_q: float     # exp(-q*T)
+    half_sig2: float  # 0.5*sigma^2
+
+
+def make_context(T: float, r: float, sigma: float, q: float = 0.0) -> BSContext:
+    """Precompute the square roots and discount factors once"""
+    sqrtT = math.sqrt(T) if T > 0 else 0.0
+    return BSContext(
+        float(T), float(r), float(q), float(sigma),
+        sqrtT, sigma * sqrtT, math.exp(-r * T), math.exp(-q * T), 0.5 * sigma * sigma
+    )
+
+
+# ============================================================================
+# SCALAR KERNELS
+# ============================================================================
+
+@njit(cache=True, fastmath=True)
+def _cnd(x):
+    """Standard normal CDF"""
+    return 0.5 * (1.0 + math.erf(x * RSQRT2))
+
+
+@njit(cache=True, fastmath=True)
+def bs_price(S, K, ctx, is_call):
+    """Option price (call if is_call else put)"""
+    if ctx.T <= 0 or ctx.sigma <= 0:
+        if is_call:
+            return max(S - K, 0.0)
+        return max(K - S, 0.0)
+
+    d1 = (math.log(S / K) + (ctx.r - ctx.q + ctx.half_sig2) * ctx.T) / ctx.sig_sqrtT
+    d2 = d1 - ctx.sig_sqrtT
+
+    if is_call:
+        price = S * ctx.disc_q * _cnd(d1) - K * ctx.disc_r * _cnd(d2)
+    else:
+        price = K * ctx.disc_r * _cnd(-d2) - S * ctx.disc_q * _cnd(-d1)
+    return max(price, 0.0)
+
+
+@njit(cache=True, fastmath=True)
+def bs_pandg(S, K, ctx, is_call):
+    """
+    Price and Greeks in one pass.
+    Returns (price, delta, gamma, theta, vega, rho) with theta per day and
+    vega/rho per 1% change, matching BlackScholes.
+    """
+    if ctx.T <= 0 or ctx.sigma <= 0:
+        if is_call:
+            return max(S - K, 0.0), (1.0 if S > K else 0.0), 0.0, 0.0, 0.0, 0.0
+        return max(K - S, 0.0), 0.0, 0.0, 0.0, 0.0, 0.0
+
+    T = ctx.T
+    r = ctx.r
+    q = ctx.q
+    disc_r = ctx.disc_r
+    disc_q = ctx.disc_q
+    d1 = (math.log(S / K) + (r - q + ctx.half_sig2) * T) / ctx.sig_sqrtT
+    d2 = d1 - ctx.sig_sqrtT
+    pdf_d1 = RSQRT2PI * math.exp(-0.5 * d1 * d1)
+
+    gamma = disc_q * pdf_d1 / (S * ctx.sig_sqrtT)
+    vega = S * disc_q * pdf_d1 * ctx.sqrtT / 100
+    theta_common = -(S * pdf_d1 * ctx.sigma * disc_q) / (2 * ctx.sqrtT)
+
+    if is_call:
+        nd1 = _cnd(d1)
+        nd2 = _cnd(d2)
+        price = S * disc_q * nd1 - K * disc_r * nd2
+        delta = disc_q * nd1
+        theta = (theta_common - r * K * disc_r * nd2 - q * S * disc_q * nd1) / 365
+        rho = K * T * disc_r * nd2 / 100
+    else:
+        nmd1 = _cnd(-d1)
+        nmd2 = _cnd(-d2)
+        price = K * disc_r * nmd2 - S * disc_q * nmd1
+        delta = -disc_q * nmd1
+        theta = (theta_common + r * K * disc_r * nmd2 - q * S * disc_q * nmd1) / 365
+        rho = -K * T * disc_r * nmd2 / 100
+
+    return max(price, 0.0), delta, gamma, theta, vega, rho
+
+
+# ============================================================================
+# VECTORIZED KERNELS (S as array, K and context fixed)
+# ============================================================================
+
+@njit(cache=True, fastmath=True)
+def bs_price_vec(S, K, ctx, is_call):
+    """Option price over an array of stock prices"""
+    price = np.empty_like(S)
+    for i in range(S.shape[0]):
+        price[i] = bs_price(S[i], K, ctx, is_call)
+    return price
+
+
+@njit(cache=True, fastmath=True)
+def bs_pandg_vec(S, K, ctx, is_call):
+    """Price and Greeks over an array of stock prices"""
+    price = np.empty_like(S)
+    delta = np.empty_like(S)
+    gamma = np.empty_like(S)
+    theta = np.empty_like(S)
+    vega = np.empty_like(S)
+    rho = np.empty_like(S)
+    for i in range(S.shape[0]):
+        price[i], delta[i], gamma[i], theta[i], vega[i], rho[i] = bs_pandg(S[i], K, ctx, is_call)
+    return price, delta, gamma, theta, vega, rho
+
+
+@njit(cache=True, fastmath=True)
+def bs_pnl_vec(S, strikes, premiums, is_call, sign, qty, ctx):
+    """
+    Summed P&L of all option legs (x100 x contracts) over an array of stock
+    prices: one call covers the full (legs x prices) grid.
+    """
+    pnl = np.zeros_like(S)
+    for j in range(strikes.shape[0]):
+        K = float(strikes[j])  # price in float64 even for float32 legs
+        premium = float(premiums[j])
+        call = is_call[j]
+        scale = sign[j] * qty[j] * 100.0
+        for i in range(S.shape[0]):
+            pnl[i] += scale * (bs_price(S[i], K, ctx, call) - premium)
+    return pnl
+
+
+# ============================================================================
+# PAYOFF KERNEL
+# ============================================================================
+
+@njit(cache=True, fastmath=True)
+def payoff_vec(S, strikes, premiums, type_sign, sign, qty):
+    """
+    Summed expiration payoff of all option legs (x100 x contracts) over an
+    array of stock prices. type_sign is +1 for calls and -1 for puts, so
+    intrinsic = max(type_sign * (S - K), 0) with no branch on the leg type.
+    """
+    payoff = np.zeros_like(S)
+    for i in range(S.shape[0]):
+        s = S[i]
+        total = 0.0
+        for j in range(strikes.shape[0]):
+            intrinsic = max(type_sign[j] * (s - strikes[j]), 0.0)
+            total += sign[j] * qty[j] * (intrinsic - premiums[j])
+        payoff[i] = total * 100.0
+    return payoff
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def bank_payoff_vec(S, strikes, premiums, type_sign, weight, stock_shares, stock_cost):
+    """
+    Expiration payoff of a batch of strategies over one price grid.
+    Leg fields are (strategies x padded legs) with weight = sign * contracts,
+    zero in padding slots; stock legs are folded into shares and cost.
+    Strategies are independent, so they are spread across threads.
+    """
+    n_strategies, n_legs = strikes.shape
+    payoff = np.empty((n_strategies, S.shape[0]), dtype=S.dtype)
+    for k in prange(n_strategies):
+        for i in range(S.shape[0]):
+            s = S[i]
+            total = 0.0
+            for j in range(n_legs):
+                intrinsic = max(type_sign[k, j] * (s - strikes[k, j]), 0.0)
+                total += weight[k, j] * (intrinsic - premiums[k, j])
+            payoff[k, i] = total * 100.0 + stock_shares[k] * s - stock_cost[k]
+    return payoff
+
+
+# ============================================================================
+# WARMUP
+# ============================================================================
+
+def warmup() -> None:
+    """
+    Compile (or load from cache) the kernels for the argument types the
+    API's analyze endpoint passes, so the first request does not pay JIT
+    latency: Python floats for the scalar kernels, main.py's cached
+    read-only float32 grid, and the writeable float32 leg columns of a
+    strategy built with add_option_leg. Other signatures (float64 grids,
+    cached template legs, StrategyBank) compile on first use.
+    """
+    ctx = make_context(30 / 365, 0.05, 0.25, 0.0)
+    bs_price(100.0, 100.0, ctx, True)
+    bs_pandg(100.0, 100.0, ctx, True)
+    S = np.array([90.0, 100.0, 110.0], dtype=np.float32)
+    S.flags.writeable = False
+    strikes = np.array([100.0], dtype=np.float32)
+    premiums = np.array([1.0], dtype=np.float32)
+    is_call = np.array([True])
+    sign = np.array([1], dtype=np.int8)
+    qty = np.array([1], dtype=np.int32)
+    bs_pnl_vec(S, strikes, premiums, is_call, sign, qty, ctx)
+    payoff_vec(S, strikes, premiums, sign, sign, qty)
+
+
+warmup()
@@ -3,17 +3,24 @@ FastAPI Backend for Options Trading Platform
 Main API with all endpoints
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Optional, Dict, Any
+from functools import lru_cache
+import msgspec
 import numpy as np
+import orjson
+import time
 from datetime import datetime
+from types import MappingProxyType
 
 # Import our strategies
 from strategies import (
     OptionsStrategy, MarketParams, OptionLeg, StockLeg,
-    ALL_STRATEGIES
+    STRATEGY_TEMPLATES, GRID_DTYPE
 )
 
 # Create FastAPI app
@@ -36,12 +43,32 @@ app.add_middleware(
 # MODELS
 # ============================================================================
 
-class StrategyRequest(BaseModel):
+class OptionLegRequest(msgspec.Struct):
+    """One option leg of a StrategyRequest"""
+    option_type: str
+    position: str
+    strike: float
+    premium: float
+    # Whole contracts: fractional or non-positive counts are rejected (422)
+    quantity: Annotated[int, msgspec.Meta(ge=1)] = 1
+
+
+class StrategyRequest(msgspec.Struct):
+    """Decoded by msgspec (C-level parse + validation) rather than Pydantic"""
     strategy_name: str
     stock_price: float
-    option_legs: List[Dict[str, Any]] = []
-    stock_legs: List[Dict[str, Any]] = []
     market_params: Dict[str, Any]
+    option_legs: List[OptionLegRequest] = []
+    stock_legs: List[Dict[str, Any]] = []
+
+
+_decode_strategy_request = msgspec.json.Decoder(StrategyRequest).decode
+
+# JSON schema for the OpenAPI docs, since FastAPI cannot introspect a Struct.
+# The leg schema is inlined: msgspec's $ref would point outside the document.
+_REQUEST_SCHEMAS = msgspec.json.schema_components([StrategyRequest])[1]
+_STRATEGY_REQUEST_SCHEMA = _REQUEST_SCHEMAS["StrategyRequest"]
+_STRATEGY_REQUEST_SCHEMA["properties"]["option_legs"]["items"] = _REQUEST_SCHEMAS["OptionLegRequest"]
 
 
 class AnalysisResponse(BaseModel):
@@ -54,6 +81,72 @@ class AnalysisResponse(BaseModel):
     payoff_data: Dict[str, List[float]]
 
 
+# ============================================================================
+# STATIC CATALOGS
+# ============================================================================
+
+# Served as-is by the list endpoints: built once, read-only, and pre-encoded
+# so those handlers do no per-request allocation or serialization.
+STRATEGY_CATALOG = MappingProxyType({
+    "basic": [
+        "Covered Call", "Covered Put", "Protective Put", "Protective Call"
+    ],
+    "spreads": [
+        "Bull Call Spread", "Bear Put Spread", "Bull Put Spread", "Bear Call Spread",
+        "Call Calendar Spread", "Put Calendar Spread", "Diagonal Call Spread", "Diagonal Put Spread"
+    ],
+    "volatility": [
+        "Long Straddle", "Short Straddle", "Long Strangle", "Short Strangle",
+        "Long Strip", "Short Strip", "Long Strap", "Short Strap"
+    ],
+    "butterflies": [
+        "Long Call Butterfly", "Long Put Butterfly", "Short Call Butterfly", "Iron Butterfly"
+    ],
+    "condors": [
+        "Iron Condor", "Long Call Condor", "Long Put Condor"
+    ],
+    "advanced": [
+        "Jade Lizard", "Seagull", "Box Spread", "Conversion", "Reversal",
+        "Poor Man's Covered Call", "Wheel Strategy (Put)", "Wheel Strategy (Call)",
+        "ZEBRA Spread", "Call Ladder", "Put Ladder", "Call Ratio Spread",
+        "Put Ratio Spread", "Call Ratio Backspread", "Collar", "Reverse Collar",
+        "Synthetic Long Stock", "Synthetic Short Stock"
+    ]
+})
+
+MARKET_STOCKS = MappingProxyType({
+    "Bancos": {
+        "GGAL": "Grupo Galicia",
+        "BMA": "Banco Macro",
+        "SUPV": "Supervielle",
+        "BBAR": "BBVA Argentina"
+    },
+    "Energía": {
+        "YPFD": "YPF",
+        "PAMP": "Pampa Energía",
+        "TGSU2": "TGS",
+        "TRAN": "Transener"
+    },
+    "Telecom": {
+        "TECO2": "Telecom Argentina",
+        "LEDE": "Ledesma"
+    },
+    "Industria": {
+        "ALUA": "Aluar",
+        "TXAR": "Ternium",
+        "COME": "Cresud"
+    },
+    "Utilities": {
+        "EDN": "Edenor",
+        "CECO2": "Central Costanera",
+        "CEPU": "Central Puerto"
+    }
+})
+
+_STRATEGY_CATALOG_JSON = orjson.dumps(dict(STRATEGY_CATALOG))
+_MARKET_STOCKS_JSON = orjson.dumps(dict(MARKET_STOCKS))
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
@@ -64,66 +157,109 @@ async def root():
         "name": "Options Trading API",
         "version": "1.0.0",
         "status": "operational",
-        "strategies": len(ALL_STRATEGIES)
+        "strategies": len(STRATEGY_TEMPLATES)
     }
 
 
+# Health probes can arrive in storms: format the timestamp at most once per second
+_health_second = -1
+_health_timestamp = ""
+
+
 @app.get("/api/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    global _health_second, _health_timestamp
+    now = int(time.time())
+    if now != _health_second:
+        _health_timestamp = datetime.fromtimestamp(now).isoformat()
+        _health_second = now
+    return {"status": "healthy", "timestamp": _health_timestamp}
+
+
+@lru_cache(maxsize=128)
+def _analysis_grid(s_bucket: float) -> np.ndarray:
+    """
+    Stock price grid (S +/- 50%, 300 points) for a price bucketed to cents.
+    Shared between requests, so it is read-only: callers must not mutate it.
+    """
+    grid = np.linspace(s_bucket * 0.5, s_bucket * 1.5, 300, dtype=GRID_DTYPE)
+    grid.flags.writeable = False
+    return grid
+
+
+def _compute_analysis(request: StrategyRequest) -> ORJSONResponse:
+    """CPU-bound part of analyze_strategy (runs in the threadpool)"""
+    # Create strategy object
+    market_params = MarketParams(**request.market_params)
+    strategy = OptionsStrategy(request.strategy_name, market_params,
+                               n_legs=len(request.option_legs))
+    
+    # Add legs (bound methods hoisted out of the loops)
+    add_option_leg = strategy.add_option_leg
+    for leg in request.option_legs:
+        add_option_leg(
+            leg.option_type,
+            leg.position,
+            leg.strike,
+            leg.premium,
+            leg.quantity
+        )
+    
+    add_stock_leg = strategy.add_stock_leg
+    for leg in request.stock_legs:
+        add_stock_leg(
+            leg['position'],
+            leg['price'],
+            leg.get('quantity', 100)
+        )
+    
+    # Analyze (payoff curves and break-evens share one price grid)
+    S_range = _analysis_grid(round(request.stock_price, 2))
+    analysis = strategy.analyze(request.stock_price, S_range)
+    
+    # Calculate risk/reward
+    rr_ratio = None
+    if analysis['max_loss_at_expiration'] < 0 and analysis['max_profit_at_expiration'] > 0:
+        rr_ratio = analysis['max_profit_at_expiration'] / abs(analysis['max_loss_at_expiration'])
+    
+    # Payoff arrays go straight to orjson (no tolist()/Pydantic round-trip);
+    # the shape is still documented by AnalysisResponse.
+    return ORJSONResponse({
+        'current_pnl': analysis['current_pnl'],
+        'max_profit': analysis['max_profit_at_expiration'],
+        'max_loss': analysis['max_loss_at_expiration'],
+        'break_evens': analysis['break_even_at_expiration'],
+        'greeks': analysis['greeks'],
+        'risk_reward_ratio': rr_ratio,
+        'payoff_data': {
+            'stock_prices': analysis['stock_prices'],
+            'payoff_expiration': analysis['payoff_expiration'],
+            'payoff_current': analysis['payoff_current']
+        }
+    })
 
 
-@app.post("/api/strategy/analyze", response_model=AnalysisResponse)
-async def analyze_strategy(request: StrategyRequest):
+@app.post(
+    "/api/strategy/analyze",
+    responses={200: {"model": AnalysisResponse}},
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _STRATEGY_REQUEST_SCHEMA}}
+    }}
+)
+async def analyze_strategy(http_request: Request):
     """Analyze an options strategy"""
     try:
-        # Create strategy object
-        market_params = MarketParams(**request.market_params)
-        strategy = OptionsStrategy(request.strategy_name, market_params)
-        
-        # Add legs
-        for leg in request.option_legs:
-            strategy.add_option_leg(
-                leg['option_type'],
-                leg['position'],
-                leg['strike'],
-                leg['premium']
-            )
-        
-        for leg in request.stock_legs:
-            strategy.add_stock_leg(
-                leg['position'],
-                leg['price'],
-                leg.get('quantity', 100)
-            )
-        
-        # Analyze
-        analysis = strategy.analyze(request.stock_price)
-        
-        # Generate payoff data
-        S_range = np.linspace(request.stock_price * 0.5, request.stock_price * 1.5, 300)
-        payoff_exp = strategy.payoff_at_expiration(S_range)
-        payoff_current = strategy.current_pnl_array(S_range)
-        
-        # Calculate risk/reward
-        rr_ratio = None
-        if analysis['max_loss_at_expiration'] < 0 and analysis['max_profit_at_expiration'] > 0:
-            rr_ratio = analysis['max_profit_at_expiration'] / abs(analysis['max_loss_at_expiration'])
-        
-        return AnalysisResponse(
-            current_pnl=analysis['current_pnl'],
-            max_profit=analysis['max_profit_at_expiration'],
-            max_loss=analysis['max_loss_at_expiration'],
-            break_evens=analysis['break_even_at_expiration'],
-            greeks=analysis['greeks'],
-            risk_reward_ratio=rr_ratio,
-            payoff_data={
-                'stock_prices': S_range.tolist(),
-                'payoff_expiration': payoff_exp.tolist(),
-                'payoff_current': payoff_current.tolist()
-            }
-        )
-        
+        request = _decode_strategy_request(await http_request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    # NumPy/Numba work is offloaded so it never blocks the event loop.
+    # The pool is AnyIO's default limiter (40 threads); raise it with
+    # anyio.to_thread.current_default_thread_limiter().total_tokens
+    # at startup if many concurrent analyses are expected.
+    try:
+        return await run_in_threadpool(_compute_analysis, request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -131,71 +267,29 @@ async def analyze_strategy(request: StrategyRequest):
 @app.get("/api/strategy/list")
 async def list_strategies():
     """Get all available strategies"""
-    strategies = {
-        "basic": [
-            "Covered Call", "Covered Put", "Protective Put", "Protective Call"
-        ],
-        "spreads": [
-            "Bull Call Spread", "Bear Put Spread", "Bull Put Spread", "Bear Call Spread",
-            "Call Calendar Spread", "Put Calendar Spread", "Diagonal Call Spread", "Diagonal Put Spread"
-        ],
-        "volatility": [
-            "Long Straddle", "Short Straddle", "Long Strangle", "Short Strangle",
-            "Long Strip", "Short Strip", "Long Strap", "Short Strap"
-        ],
-        "butterflies": [
-            "Long Call Butterfly", "Long Put Butterfly", "Short Call Butterfly", "Iron Butterfly"
-        ],
-        "condors": [
-            "Iron Condor", "Long Call Condor", "Long Put Condor"
-        ],
-        "advanced": [
-            "Jade Lizard", "Seagull", "Box Spread", "Conversion", "Reversal",
-            "Poor Man's Covered Call", "Wheel Strategy (Put)", "Wheel Strategy (Call)",
-            "ZEBRA Spread", "Call Ladder", "Put Ladder", "Call Ratio Spread",
-            "Put Ratio Spread", "Call Ratio Backspread", "Collar", "Reverse Collar",
-            "Synthetic Long Stock", "Synthetic Short Stock"
-        ]
-    }
-    return strategies
+    return Response(content=_STRATEGY_CATALOG_JSON, media_type="application/json")
 
 
 @app.get("/api/market/stocks")
 async def get_stocks():
     """Get list of Argentine stocks"""
-    return {
-        "Bancos": {
-            "GGAL": "Grupo Galicia",
-            "BMA": "Banco Macro",
-            "SUPV": "Supervielle",
-            "BBAR": "BBVA Argentina"
-        },
-        "Energía": {
-            "YPFD": "YPF",
-            "PAMP": "Pampa Energía",
-            "TGSU2": "TGS",
-            "TRAN": "Transener"
-        },
-        "Telecom": {
-            "TECO2": "Telecom Argentina",
-            "LEDE": "Ledesma"
-        },
-        "Industria": {
-            "ALUA": "Aluar",
-            "TXAR": "Ternium",
-            "COME": "Cresud"
-        },
-        "Utilities": {
-            "EDN": "Edenor",
-            "CECO2": "Central Costanera",
-            "CEPU": "Central Puerto"
-        }
-    }
+    return Response(content=_MARKET_STOCKS_JSON, media_type="application/json")
 
 
 # Vercel serverless handler
 handler = app
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools event loop/parser, one worker per core
+    # (workers > 1 needs the app as an import string)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
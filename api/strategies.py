@@ -3,37 +3,69 @@ Complete Options Strategies Library - 50+ Strategies
 Consolidated from options_strategies_enhanced.py + advanced_strategies.py
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict, Any
+from enum import IntEnum
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple, Dict, Any, Union
 import numpy as np
-from scipy.stats import norm
+from numba import njit
+
+from bs_kernel import (
+    RSQRT2PI, BSContext, make_context, bs_price, bs_pandg, bs_price_vec, bs_pandg_vec,
+    bs_pnl_vec, payoff_vec, bank_payoff_vec
+)
+
+# Ahead-of-time payoff kernel (_payoff.pyx, built by _build_payoff.py).
+# Deployments without the compiled module use the Numba kernel.
+try:
+    from _payoff import payoff_batch
+except ImportError:
+    payoff_batch = None
 
 
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+class OptType(IntEnum):
+    """Option type; the value doubles as the is_call flag"""
+    PUT = 0
+    CALL = 1
+
+
+class Side(IntEnum):
+    """Position side; the value is the P&L sign"""
+    LONG = 1
+    SHORT = -1
+
+
+@dataclass(frozen=True)
 class MarketParams:
-    """Market parameters for options pricing"""
+    """Market parameters for options pricing (immutable, hashable)"""
     risk_free_rate: float = 0.05
     volatility: float = 0.25
     dividend_yield: float = 0.0
     days_to_expiration: int = 30
 
 
-@dataclass
+# Shared default for every factory and OptionsStrategy (MarketParams is frozen)
+DEFAULT_MARKET_PARAMS = MarketParams()
+
+
+@dataclass(frozen=True)
 class OptionLeg:
-    """Single option leg"""
+    """Single option leg (immutable: OptionsStrategy stores legs as arrays)"""
     option_type: str  # 'call' or 'put'
     position: str  # 'long' or 'short'
     strike: float
     premium: float
+    quantity: int = 1  # contracts
 
 
-@dataclass
+@dataclass(frozen=True)
 class StockLeg:
-    """Stock position leg"""
+    """Stock position leg (immutable: catalog builds share them with the leg cache)"""
     position: str  # 'long' or 'short'
     price: float
     quantity: int = 100
@@ -43,32 +75,70 @@ class StockLeg:
 # BLACK-SCHOLES PRICING ENGINE
 # ============================================================================
 
+# Standard normal helpers. SciPy is only needed by the scalar Greeks below,
+# never by the compiled hot path, so it is imported
+# on first use to keep it out of serverless cold starts.
+def _cdf(x):
+    """Standard normal CDF (scipy.special.ndtr); works on scalars and arrays"""
+    from scipy.special import ndtr
+    return ndtr(x)
+
+
+def _pdf(x):
+    """Standard normal PDF"""
+    return RSQRT2PI * np.exp(-0.5 * x * x)
+
+
+# Scalar kernel calls are memoized: interactive use re-prices the same
+# (S, K, context) combinations over and over, and the context is a hashable
+# NamedTuple. Shared by OptionsStrategy.current_pnl/greeks and
+# BlackScholes.call_price/put_price.
+BS_CACHE_SIZE = 4096
+_leg_price = lru_cache(maxsize=BS_CACHE_SIZE)(bs_price)
+_leg_pandg = lru_cache(maxsize=BS_CACHE_SIZE)(bs_pandg)
+
+
+# Stock price grids (payoff curves) are stored in float32: cent-level prices
+# and P&L need nowhere near float64 precision, and half the bytes per point
+# halves memory traffic. The kernels still accumulate in float64 registers.
+GRID_DTYPE = np.float32
+
+# Leg strikes and premiums are quoted to cents as well; float32 columns
+# halve the bytes the payoff kernels stream per leg. OptionsStrategy takes
+# dtype=np.float64 for cases that need the extra precision.
+LEG_FLOAT_DTYPE = np.float32
+
+
+def _price_grid(S: np.ndarray) -> np.ndarray:
+    """Stock prices as a float array, keeping float32/float64 grids as given"""
+    S = np.asarray(S)
+    if S.dtype != np.float32 and S.dtype != np.float64:
+        S = S.astype(float)
+    return S
+
+
 class BlackScholes:
     """Complete Black-Scholes option pricing with Greeks"""
     
+    @staticmethod
+    def make_ctx(market_params: MarketParams) -> BSContext:
+        """Per-analysis pricing context (sqrt(T), discount factors) for the kernels"""
+        return make_context(
+            market_params.days_to_expiration / 365,
+            market_params.risk_free_rate,
+            market_params.volatility,
+            market_params.dividend_yield
+        )
+    
     @staticmethod
     def call_price(S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0) -> float:
-        """Call option price"""
-        if T <= 0 or sigma <= 0:
-            return max(S - K, 0)
-        
-        d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
-        d2 = d1 - sigma*np.sqrt(T)
-        
-        call = S*np.exp(-q*T)*norm.cdf(d1) - K*np.exp(-r*T)*norm.cdf(d2)
-        return max(call, 0)
+        """Call option price (memoized)"""
+        return _leg_price(S, K, make_context(T, r, sigma, q), True)
     
     @staticmethod
     def put_price(S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0) -> float:
-        """Put option price"""
-        if T <= 0 or sigma <= 0:
-            return max(K - S, 0)
-        
-        d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
-        d2 = d1 - sigma*np.sqrt(T)
-        
-        put = K*np.exp(-r*T)*norm.cdf(-d2) - S*np.exp(-q*T)*norm.cdf(-d1)
-        return max(put, 0)
+        """Put option price (memoized)"""
+        return _leg_price(S, K, make_context(T, r, sigma, q), False)
     
     @staticmethod
     def delta(S: float, K: float, T: float, r: float, sigma: float, 
@@ -80,9 +150,9 @@ class BlackScholes:
         d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
         
         if option_type == 'call':
-            return np.exp(-q*T) * norm.cdf(d1)
+            return np.exp(-q*T) * _cdf(d1)
         else:
-            return -np.exp(-q*T) * norm.cdf(-d1)
+            return -np.exp(-q*T) * _cdf(-d1)
     
     @staticmethod
     def gamma(S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0) -> float:
@@ -91,7 +161,7 @@ class BlackScholes:
             return 0.0
         
         d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
-        return np.exp(-q*T) * norm.pdf(d1) / (S * sigma * np.sqrt(T))
+        return np.exp(-q*T) * _pdf(d1) / (S * sigma * np.sqrt(T))
     
     @staticmethod
     def theta(S: float, K: float, T: float, r: float, sigma: float,
@@ -103,15 +173,15 @@ class BlackScholes:
         d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
         d2 = d1 - sigma*np.sqrt(T)
         
-        term1 = -(S * norm.pdf(d1) * sigma * np.exp(-q*T)) / (2 * np.sqrt(T))
+        term1 = -(S * _pdf(d1) * sigma * np.exp(-q*T)) / (2 * np.sqrt(T))
         
         if option_type == 'call':
-            term2 = r * K * np.exp(-r*T) * norm.cdf(d2)
-            term3 = -q * S * np.exp(-q*T) * norm.cdf(d1)
+            term2 = r * K * np.exp(-r*T) * _cdf(d2)
+            term3 = -q * S * np.exp(-q*T) * _cdf(d1)
             return (term1 - term2 + term3) / 365
         else:
-            term2 = r * K * np.exp(-r*T) * norm.cdf(-d2)
-            term3 = q * S * np.exp(-q*T) * norm.cdf(-d1)
+            term2 = r * K * np.exp(-r*T) * _cdf(-d2)
+            term3 = q * S * np.exp(-q*T) * _cdf(-d1)
             return (term1 + term2 - term3) / 365
     
     @staticmethod
@@ -121,7 +191,7 @@ class BlackScholes:
             return 0.0
         
         d1 = (np.log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*np.sqrt(T))
-        return S * np.exp(-q*T) * norm.pdf(d1) * np.sqrt(T) / 100
+        return S * np.exp(-q*T) * _pdf(d1) * np.sqrt(T) / 100
     
     @staticmethod
     def rho(S: float, K: float, T: float, r: float, sigma: float,
@@ -134,9 +204,61 @@ class BlackScholes:
         d2 = d1 - sigma*np.sqrt(T)
         
         if option_type == 'call':
-            return K * T * np.exp(-r*T) * norm.cdf(d2) / 100
+            return K * T * np.exp(-r*T) * _cdf(d2) / 100
         else:
-            return -K * T * np.exp(-r*T) * norm.cdf(-d2) / 100
+            return -K * T * np.exp(-r*T) * _cdf(-d2) / 100
+
+    # ------------------------------------------------------------------------
+    # Vectorized variants: S is an array, K/T/r/sigma/q are scalars.
+    # Thin wrappers over the compiled bs_kernel loops.
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def call_price_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                       q: float = 0.0) -> np.ndarray:
+        """Call option price over an array of stock prices"""
+        return bs_price_vec(np.asarray(S_arr, dtype=float), K, make_context(T, r, sigma, q), True)
+    
+    @staticmethod
+    def put_price_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                      q: float = 0.0) -> np.ndarray:
+        """Put option price over an array of stock prices"""
+        return bs_price_vec(np.asarray(S_arr, dtype=float), K, make_context(T, r, sigma, q), False)
+    
+    @staticmethod
+    def delta_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                  option_type: str, q: float = 0.0) -> np.ndarray:
+        """Delta over an array of stock prices"""
+        return _greek_vec(S_arr, K, T, r, sigma, q, option_type == 'call')[1]
+    
+    @staticmethod
+    def gamma_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                  q: float = 0.0) -> np.ndarray:
+        """Gamma over an array of stock prices"""
+        return _greek_vec(S_arr, K, T, r, sigma, q, True)[2]
+    
+    @staticmethod
+    def theta_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                  option_type: str, q: float = 0.0) -> np.ndarray:
+        """Theta (per day) over an array of stock prices"""
+        return _greek_vec(S_arr, K, T, r, sigma, q, option_type == 'call')[3]
+    
+    @staticmethod
+    def vega_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                 q: float = 0.0) -> np.ndarray:
+        """Vega (per 1% change) over an array of stock prices"""
+        return _greek_vec(S_arr, K, T, r, sigma, q, True)[4]
+    
+    @staticmethod
+    def rho_vec(S_arr: np.ndarray, K: float, T: float, r: float, sigma: float,
+                option_type: str, q: float = 0.0) -> np.ndarray:
+        """Rho (per 1% change) over an array of stock prices"""
+        return _greek_vec(S_arr, K, T, r, sigma, q, option_type == 'call')[5]
+
+
+def _greek_vec(S_arr, K, T, r, sigma, q, is_call):
+    """(price, delta, gamma, theta, vega, rho) arrays from the compiled kernel"""
+    return bs_pandg_vec(np.asarray(S_arr, dtype=float), K, make_context(T, r, sigma, q), is_call)
 
 
 # ============================================================================
@@ -146,20 +268,172 @@ class BlackScholes:
 class OptionsStrategy:
     """Base class for all options strategies"""
     
-    def __init__(self, name: str, market_params: Optional[MarketParams] = None):
+    # Fixed attribute set: no per-instance __dict__ for strategies built in bulk
+    __slots__ = (
+        'name', 'stock_legs', 'market_params', 'constant_payoff', 'dtype',
+        'strikes', 'premiums', 'is_call', 'sign', 'qty', '_type_sign',
+        '_buffers', '_n_legs'
+    )
+    
+    def __init__(self, name: str, market_params: MarketParams = DEFAULT_MARKET_PARAMS,
+                 constant_payoff: Optional[float] = None, dtype=LEG_FLOAT_DTYPE,
+                 n_legs: int = 0, legs: Optional[Tuple[np.ndarray, ...]] = None):
         self.name = name
-        self.option_legs: List[OptionLeg] = []
         self.stock_legs: List[StockLeg] = []
-        self.market_params = market_params or MarketParams()
+        # None still means "default" for callers of the old Optional signature
+        self.market_params = market_params if market_params is not None else DEFAULT_MARKET_PARAMS
+        # Expiration payoff when it does not depend on the stock price (box,
+        # conversion, reversal). Legs are still stored for Greeks and the
+        # pre-expiration P&L; adding a leg invalidates it.
+        self.constant_payoff = constant_payoff
+        
+        # Option legs stored column-wise (SoA), one entry per leg. The columns
+        # are views into buffers preallocated for n_legs legs (the leg count
+        # is known up front for API requests); adding past the capacity
+        # reallocates. legs passes prebuilt, exactly-sized columns in the
+        # order below (template builds), which are adopted without copying.
+        if legs is not None:
+            self.dtype = legs[0].dtype
+            self._set_buffers(legs, len(legs[0]))
+            return
+        self.dtype = np.dtype(dtype)  # strikes/premiums storage
+        self._set_buffers((
+            np.empty(n_legs, dtype=self.dtype),  # strikes
+            np.empty(n_legs, dtype=self.dtype),  # premiums
+            np.empty(n_legs, dtype=bool),        # is_call
+            np.empty(n_legs, dtype=np.int8),     # sign: +1 long, -1 short
+            np.empty(n_legs, dtype=np.int32),    # qty: contracts per leg
+            np.empty(n_legs, dtype=np.int8),     # _type_sign: +1 call, -1 put
+        ), 0)
+    
+    def _set_buffers(self, buffers: Tuple[np.ndarray, ...], n_legs: int):
+        """Adopt leg buffers holding n_legs legs and refresh the column views"""
+        self._buffers = buffers
+        self._n_legs = n_legs
+        if len(buffers[0]) != n_legs:
+            buffers = tuple(buf[:n_legs] for buf in buffers)
+        self.strikes, self.premiums, self.is_call, self.sign, self.qty, self._type_sign = buffers
     
-    def add_option_leg(self, option_type: str, position: str, strike: float, premium: float):
-        self.option_legs.append(OptionLeg(option_type, position, strike, premium))
+    @property
+    def option_legs(self) -> Tuple[OptionLeg, ...]:
+        """
+        Option legs as OptionLeg records: a read-only snapshot of the arrays,
+        so mutating it fails instead of being silently dropped. Add legs
+        with add_option_leg/add_legs_batch.
+        """
+        return tuple(
+            OptionLeg('call' if is_call else 'put', 'long' if sign > 0 else 'short', strike, premium, qty)
+            for is_call, sign, strike, premium, qty in zip(
+                self.is_call.tolist(), self.sign.tolist(), self.strikes.tolist(),
+                self.premiums.tolist(), self.qty.tolist()
+            )
+        )
+    
+    def add_legs_batch(self, option_types, positions, strikes, premiums, quantities=1):
+        """
+        Append several option legs at once from parallel sequences
+        ('call'/'put', 'long'/'short', strike, premium, contracts). Types may
+        also be given as OptType/booleans and positions as Side/signs (+1/-1);
+        a bool array of types and an int8 array of +1/-1 signs are taken
+        as-is, without parsing. Scalar strikes, premiums or contracts apply
+        to every leg; other lengths must match.
+        """
+        if not (isinstance(option_types, np.ndarray) and option_types.dtype == np.bool_):
+            option_types = np.asarray(option_types)
+            if option_types.dtype.kind in 'US':
+                option_types = option_types == 'call'
+            else:
+                option_types = option_types.astype(bool)
+        if not (isinstance(positions, np.ndarray) and positions.dtype == np.int8):
+            positions = np.asarray(positions)
+            if positions.dtype.kind in 'US':
+                positions = positions == 'long'
+            else:
+                positions = positions > 0
+            positions = positions.view(np.int8) * np.int8(2) - np.int8(1)
+        type_sign = option_types.view(np.int8) * np.int8(2) - np.int8(1)
+        self._append_legs(len(positions), strikes, premiums, option_types, positions,
+                          quantities, type_sign)
+        if self._has_duplicate_legs():
+            self._canonicalize()
+    
+    def add_option_leg(self, option_type: Union[str, OptType], position: Union[str, Side],
+                       strike: float, premium: float, qty: int = 1):
+        # Single leg: resolve type and side with plain compares, no array parsing
+        is_call = option_type == 'call' if isinstance(option_type, str) else bool(option_type)
+        if isinstance(position, str):
+            sign = 1 if position == 'long' else -1
+        else:
+            sign = 1 if position > 0 else -1
+        self._append_legs(1, strike, premium, is_call, sign, qty, 1 if is_call else -1)
+        n = self._n_legs - 1
+        if n and ((self.strikes[:n] == self.strikes[n]) & (self.is_call[:n] == is_call)
+                  & (self.sign[:n] == sign)).any():
+            self._canonicalize()
+    
+    def _append_legs(self, n, strikes, premiums, is_call, sign, qty, type_sign):
+        """Write n legs (columns or scalars) after the current ones, growing the buffers if full"""
+        self.constant_payoff = None
+        start = self._n_legs
+        stop = start + n
+        buffers = self._buffers
+        if stop > len(buffers[0]):
+            capacity = max(stop, 2 * len(buffers[0]))
+            buffers = tuple(np.concatenate((buf[:start], np.empty(capacity - start, dtype=buf.dtype)))
+                            for buf in buffers)
+        for buf, column in zip(buffers, (strikes, premiums, is_call, sign, qty, type_sign)):
+            buf[start:stop] = column
+        self._set_buffers(buffers, stop)
+    
+    def _has_duplicate_legs(self) -> bool:
+        """Whether two legs share (type, strike, side); cheap next to _canonicalize"""
+        keys = list(zip(self.strikes.tolist(), self.is_call.tolist(), self.sign.tolist()))
+        return len(set(keys)) != len(keys)
+    
+    def _canonicalize(self):
+        """
+        Merge legs with the same (type, strike, side) into one leg, keeping
+        first-occurrence order: contracts add up and the premium becomes the
+        contract-weighted average, so payoffs and Greeks are unchanged.
+        Groups whose contracts sum to zero are left unmerged.
+        """
+        keys = np.stack((self.strikes.astype(float), self.is_call, self.sign), axis=1)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        if len(first) == self._n_legs:
+            return
+        order = np.argsort(first)
+        group = np.empty_like(order)
+        group[order] = np.arange(len(order))
+        group = group[inverse.ravel()]
+        
+        qty = np.bincount(group, weights=self.qty)
+        premium_total = np.bincount(group, weights=self.qty * self.premiums.astype(float))
+        # A group whose contracts cancel out (e.g. +1 and -1) cannot carry its
+        # net premium in a single leg: keep its legs as they are
+        merged = (qty != 0)[group]
+        is_first = np.zeros(self._n_legs, dtype=bool)
+        is_first[first] = True
+        keep = np.flatnonzero(is_first | ~merged)
+        if len(keep) == self._n_legs:
+            return
+        premiums = np.divide(premium_total, qty, out=np.zeros_like(qty), where=qty != 0)
+        self._set_buffers((
+            self.strikes[keep],
+            np.where(merged, premiums[group], self.premiums)[keep].astype(self.dtype),
+            self.is_call[keep], self.sign[keep],
+            np.where(merged, qty[group], self.qty)[keep].astype(np.int32),
+            self._type_sign[keep]
+        ), len(keep))
     
     def add_stock_leg(self, position: str, price: float, quantity: int = 100):
+        self.constant_payoff = None
         self.stock_legs.append(StockLeg(position, price, quantity))
     
     def payoff_at_expiration(self, S_T: np.ndarray) -> np.ndarray:
         """Calculate payoff at expiration"""
+        S_T = _price_grid(S_T)
+        if self.constant_payoff is not None:
+            return np.full_like(S_T, self.constant_payoff)
         payoff = np.zeros_like(S_T)
         
         # Stock legs
@@ -169,23 +443,24 @@ class OptionsStrategy:
             else:
                 payoff += (leg.price - S_T) * leg.quantity
         
-        # Option legs
-        for leg in self.option_legs:
-            if leg.option_type == 'call':
-                intrinsic = np.maximum(S_T - leg.strike, 0)
-            else:
-                intrinsic = np.maximum(leg.strike - S_T, 0)
-            
-            if leg.position == 'long':
-                payoff += (intrinsic - leg.premium) * 100
-            else:
-                payoff += (leg.premium - intrinsic) * 100
+        # Option legs - one compiled (prices x legs) reduction
+        S_flat = S_T.ravel()
+        strikes = self.strikes.astype(S_T.dtype, copy=False)
+        premiums = self.premiums.astype(S_T.dtype, copy=False)
+        if payoff_batch is not None:
+            option_payoff = np.empty_like(S_flat)
+            payoff_batch(S_flat, strikes, premiums, self._type_sign, self.sign, self.qty, option_payoff)
+        else:
+            option_payoff = payoff_vec(S_flat, strikes, premiums, self._type_sign, self.sign, self.qty)
+        payoff += option_payoff.reshape(S_T.shape)
         
         return payoff
     
     def current_pnl(self, S: float) -> float:
         """Calculate current P&L before expiration"""
-        T = self.market_params.days_to_expiration / 365
+        ctx = BlackScholes.make_ctx(self.market_params)
+        # Expired or zero vol: options are worth intrinsic value, no Black-Scholes
+        intrinsic = ctx.T <= 0 or ctx.sigma <= 0
         pnl = 0.0
         
         # Stock legs
@@ -196,36 +471,70 @@ class OptionsStrategy:
                 pnl += (leg.price - S) * leg.quantity
         
         # Option legs
-        for leg in self.option_legs:
-            if leg.option_type == 'call':
-                current_value = BlackScholes.call_price(
-                    S, leg.strike, T, 
-                    self.market_params.risk_free_rate,
-                    self.market_params.volatility,
-                    self.market_params.dividend_yield
-                )
+        for strike, premium, is_call, sign, qty in zip(self.strikes.tolist(), self.premiums.tolist(),
+                                                       self.is_call.tolist(), self.sign.tolist(),
+                                                       self.qty.tolist()):
+            if intrinsic:
+                current_value = max(S - strike, 0.0) if is_call else max(strike - S, 0.0)
             else:
-                current_value = BlackScholes.put_price(
-                    S, leg.strike, T,
-                    self.market_params.risk_free_rate,
-                    self.market_params.volatility,
-                    self.market_params.dividend_yield
-                )
-            
-            if leg.position == 'long':
-                pnl += (current_value - leg.premium) * 100
-            else:
-                pnl += (leg.premium - current_value) * 100
+                current_value = _leg_price(S, strike, ctx, is_call)
+            pnl += sign * qty * (current_value - premium) * 100
         
         return pnl
     
     def current_pnl_array(self, S_array: np.ndarray) -> np.ndarray:
         """Calculate current P&L for array of stock prices"""
-        return np.array([self.current_pnl(S) for S in S_array])
+        S_array = _price_grid(S_array)
+        ctx = BlackScholes.make_ctx(self.market_params)
+        if ctx.T <= 0 or ctx.sigma <= 0:
+            # Options are worth intrinsic value: skip Black-Scholes entirely
+            return self.payoff_at_expiration(S_array)
+        pnl = np.zeros_like(S_array)
+        
+        # Stock legs
+        for leg in self.stock_legs:
+            sign = 1 if leg.position == 'long' else -1
+            pnl += (S_array - leg.price) * (leg.quantity * sign)
+        
+        # Option legs - a single compiled pass over the whole (legs x prices) grid
+        pnl += bs_pnl_vec(S_array, self.strikes, self.premiums, self.is_call,
+                          self.sign, self.qty, ctx)
+        
+        return pnl
+    
+    def greeks_array(self, S_array: np.ndarray) -> Dict[str, np.ndarray]:
+        """Calculate all Greeks for array of stock prices"""
+        S_array = _price_grid(S_array)
+        ctx = BlackScholes.make_ctx(self.market_params)
+        greeks = {name: np.zeros_like(S_array) for name in ('delta', 'gamma', 'theta', 'vega', 'rho')}
+        
+        # Stock legs
+        for leg in self.stock_legs:
+            multiplier = 1 if leg.position == 'long' else -1
+            greeks['delta'] += leg.quantity * multiplier
+        
+        if ctx.T <= 0 or ctx.sigma <= 0:
+            # Expired: delta steps at the strike, all other Greeks vanish
+            itm_calls = self.is_call[:, None] & (S_array[None, :] > self.strikes[:, None])
+            greeks['delta'] += ((self.sign * self.qty)[:, None] * itm_calls).sum(axis=0) * 100
+            return greeks
+        
+        # Option legs
+        for strike, is_call, sign, qty in zip(self.strikes.tolist(), self.is_call.tolist(),
+                                              self.sign.tolist(), self.qty.tolist()):
+            multiplier = sign * qty * 100
+            _, delta, gamma, theta, vega, rho = bs_pandg_vec(S_array, strike, ctx, is_call)
+            greeks['delta'] += multiplier * delta
+            greeks['gamma'] += multiplier * gamma
+            greeks['theta'] += multiplier * theta
+            greeks['vega'] += multiplier * vega
+            greeks['rho'] += multiplier * rho
+        
+        return greeks
     
     def greeks(self, S: float) -> Dict[str, float]:
         """Calculate all Greeks"""
-        T = self.market_params.days_to_expiration / 365
+        ctx = BlackScholes.make_ctx(self.market_params)
         greeks = {'delta': 0.0, 'gamma': 0.0, 'theta': 0.0, 'vega': 0.0, 'rho': 0.0}
         
         # Stock legs
@@ -233,656 +542,643 @@ class OptionsStrategy:
             multiplier = 1 if leg.position == 'long' else -1
             greeks['delta'] += leg.quantity * multiplier
         
-        # Option legs
-        for leg in self.option_legs:
-            multiplier = 1 if leg.position == 'long' else -1
-            
-            greeks['delta'] += multiplier * BlackScholes.delta(
-                S, leg.strike, T, self.market_params.risk_free_rate,
-                self.market_params.volatility, leg.option_type,
-                self.market_params.dividend_yield
-            ) * 100
-            
-            greeks['gamma'] += multiplier * BlackScholes.gamma(
-                S, leg.strike, T, self.market_params.risk_free_rate,
-                self.market_params.volatility, self.market_params.dividend_yield
-            ) * 100
-            
-            greeks['theta'] += multiplier * BlackScholes.theta(
-                S, leg.strike, T, self.market_params.risk_free_rate,
-                self.market_params.volatility, leg.option_type,
-                self.market_params.dividend_yield
-            ) * 100
-            
-            greeks['vega'] += multiplier * BlackScholes.vega(
-                S, leg.strike, T, self.market_params.risk_free_rate,
-                self.market_params.volatility, self.market_params.dividend_yield
-            ) * 100
-            
-            greeks['rho'] += multiplier * BlackScholes.rho(
-                S, leg.strike, T, self.market_params.risk_free_rate,
-                self.market_params.volatility, leg.option_type,
-                self.market_params.dividend_yield
-            ) * 100
+        if ctx.T <= 0 or ctx.sigma <= 0:
+            # Expired: delta steps at the strike, all other Greeks vanish
+            greeks['delta'] += float((self.sign * self.qty * (self.is_call & (S > self.strikes))).sum()) * 100
+            return greeks
+        
+        # Option legs - price and all Greeks in a single kernel call
+        for strike, is_call, sign, qty in zip(self.strikes.tolist(), self.is_call.tolist(),
+                                              self.sign.tolist(), self.qty.tolist()):
+            multiplier = sign * qty * 100
+            _, delta, gamma, theta, vega, rho = _leg_pandg(S, strike, ctx, is_call)
+            greeks['delta'] += multiplier * delta
+            greeks['gamma'] += multiplier * gamma
+            greeks['theta'] += multiplier * theta
+            greeks['vega'] += multiplier * vega
+            greeks['rho'] += multiplier * rho
         
         return greeks
     
-    def analyze(self, S: float) -> Dict[str, Any]:
-        """Complete strategy analysis"""
+    def analyze(self, S: float, S_range: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Complete strategy analysis.
+        S_range is the stock price grid shared by the payoff curves and the
+        max/min/break-even search (defaults to 300 points over S +/- 50%).
+        """
         # Current P&L
         current_pnl = self.current_pnl(S)
         
         # Greeks
         greeks = self.greeks(S)
         
-        # Max profit/loss at expiration
-        S_range = np.linspace(S * 0.5, S * 1.5, 500)
+        # Payoff curves
+        if S_range is None:
+            S_range = np.linspace(S * 0.5, S * 1.5, 300, dtype=GRID_DTYPE)
+        S_range = _price_grid(S_range)
         payoffs = self.payoff_at_expiration(S_range)
+        payoff_current = self.current_pnl_array(S_range)
         
+        # Max profit/loss at expiration
         max_profit = float(np.max(payoffs))
         max_loss = float(np.min(payoffs))
         
-        # Break-evens
-        break_evens = []
-        for i in range(len(payoffs) - 1):
-            if payoffs[i] * payoffs[i+1] < 0:
-                be = S_range[i] - payoffs[i] * (S_range[i+1] - S_range[i]) / (payoffs[i+1] - payoffs[i])
-                break_evens.append(float(be))
+        # Break-evens: linear interpolation at every sign change
+        signs = payoffs < 0
+        idx = np.flatnonzero(signs[:-1] != signs[1:])
+        x0, x1 = S_range[idx], S_range[idx + 1]
+        y0, y1 = payoffs[idx], payoffs[idx + 1]
+        break_evens = (x0 - y0 * (x1 - x0) / (y1 - y0)).tolist()
         
         return {
             'current_pnl': current_pnl,
             'max_profit_at_expiration': max_profit,
             'max_loss_at_expiration': max_loss,
             'break_even_at_expiration': break_evens,
-            'greeks': greeks
+            'greeks': greeks,
+            'stock_prices': S_range,
+            'payoff_expiration': payoffs,
+            'payoff_current': payoff_current
         }
 
 
 # ============================================================================
-# BASIC STRATEGIES (4)
-# ============================================================================
-
-def covered_call(stock_price: float, call_strike: float, call_premium: float,
-                 market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Covered Call - Long stock + Short call"""
-    strategy = OptionsStrategy("Covered Call", market_params)
-    strategy.add_stock_leg('long', stock_price, 100)
-    strategy.add_option_leg('call', 'short', call_strike, call_premium)
-    return strategy
-
-
-def covered_put(stock_price: float, put_strike: float, put_premium: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Covered Put - Short stock + Short put"""
-    strategy = OptionsStrategy("Covered Put", market_params)
-    strategy.add_stock_leg('short', stock_price, 100)
-    strategy.add_option_leg('put', 'short', put_strike, put_premium)
-    return strategy
-
-
-def protective_put(stock_price: float, put_strike: float, put_premium: float,
-                   market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Protective Put - Long stock + Long put"""
-    strategy = OptionsStrategy("Protective Put", market_params)
-    strategy.add_stock_leg('long', stock_price, 100)
-    strategy.add_option_leg('put', 'long', put_strike, put_premium)
-    return strategy
-
-
-def protective_call(stock_price: float, call_strike: float, call_premium: float,
-                    market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Protective Call - Short stock + Long call"""
-    strategy = OptionsStrategy("Protective Call", market_params)
-    strategy.add_stock_leg('short', stock_price, 100)
-    strategy.add_option_leg('call', 'long', call_strike, call_premium)
-    return strategy
-
-
+# STRATEGY BANK
 # ============================================================================
-# VERTICAL SPREADS (4)
-# ============================================================================
-
-def bull_call_spread(lower_strike: float, upper_strike: float,
-                     lower_premium: float, upper_premium: float,
-                     market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Bull Call Spread - Long lower call + Short upper call"""
-    strategy = OptionsStrategy("Bull Call Spread", market_params)
-    strategy.add_option_leg('call', 'long', lower_strike, lower_premium)
-    strategy.add_option_leg('call', 'short', upper_strike, upper_premium)
-    return strategy
-
-
-def bear_put_spread(lower_strike: float, upper_strike: float,
-                    lower_premium: float, upper_premium: float,
-                    market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Bear Put Spread - Long upper put + Short lower put"""
-    strategy = OptionsStrategy("Bear Put Spread", market_params)
-    strategy.add_option_leg('put', 'long', upper_strike, upper_premium)
-    strategy.add_option_leg('put', 'short', lower_strike, lower_premium)
-    return strategy
-
-
-def bull_put_spread(lower_strike: float, upper_strike: float,
-                    lower_premium: float, upper_premium: float,
-                    market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Bull Put Spread - Short upper put + Long lower put"""
-    strategy = OptionsStrategy("Bull Put Spread", market_params)
-    strategy.add_option_leg('put', 'short', upper_strike, upper_premium)
-    strategy.add_option_leg('put', 'long', lower_strike, lower_premium)
-    return strategy
-
-
-def bear_call_spread(lower_strike: float, upper_strike: float,
-                     lower_premium: float, upper_premium: float,
-                     market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Bear Call Spread - Short lower call + Long upper call"""
-    strategy = OptionsStrategy("Bear Call Spread", market_params)
-    strategy.add_option_leg('call', 'short', lower_strike, lower_premium)
-    strategy.add_option_leg('call', 'long', upper_strike, upper_premium)
-    return strategy
-
-
-# ============================================================================
-# STRADDLES & STRANGLES (4)
-# ============================================================================
-
-def long_straddle(strike: float, call_premium: float, put_premium: float,
-                  market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Straddle - Long call + Long put (same strike)"""
-    strategy = OptionsStrategy("Long Straddle", market_params)
-    strategy.add_option_leg('call', 'long', strike, call_premium)
-    strategy.add_option_leg('put', 'long', strike, put_premium)
-    return strategy
-
-
-def short_straddle(strike: float, call_premium: float, put_premium: float,
-                   market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Short Straddle - Short call + Short put (same strike)"""
-    strategy = OptionsStrategy("Short Straddle", market_params)
-    strategy.add_option_leg('call', 'short', strike, call_premium)
-    strategy.add_option_leg('put', 'short', strike, put_premium)
-    return strategy
-
-
-def long_strangle(call_strike: float, put_strike: float,
-                  call_premium: float, put_premium: float,
-                  market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Strangle - Long OTM call + Long OTM put"""
-    strategy = OptionsStrategy("Long Strangle", market_params)
-    strategy.add_option_leg('call', 'long', call_strike, call_premium)
-    strategy.add_option_leg('put', 'long', put_strike, put_premium)
-    return strategy
-
-
-def short_strangle(call_strike: float, put_strike: float,
-                   call_premium: float, put_premium: float,
-                   market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Short Strangle - Short OTM call + Short OTM put"""
-    strategy = OptionsStrategy("Short Strangle", market_params)
-    strategy.add_option_leg('call', 'short', call_strike, call_premium)
-    strategy.add_option_leg('put', 'short', put_strike, put_premium)
-    return strategy
-
-
-# ============================================================================
-# BUTTERFLIES (4)
-# ============================================================================
-
-def long_call_butterfly(lower_strike: float, middle_strike: float, upper_strike: float,
-                        lower_premium: float, middle_premium: float, upper_premium: float,
-                        market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Call Butterfly"""
-    strategy = OptionsStrategy("Long Call Butterfly", market_params)
-    strategy.add_option_leg('call', 'long', lower_strike, lower_premium)
-    strategy.add_option_leg('call', 'short', middle_strike, middle_premium)
-    strategy.add_option_leg('call', 'short', middle_strike, middle_premium)
-    strategy.add_option_leg('call', 'long', upper_strike, upper_premium)
-    return strategy
 
-
-def long_put_butterfly(lower_strike: float, middle_strike: float, upper_strike: float,
-                       lower_premium: float, middle_premium: float, upper_premium: float,
-                       market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Put Butterfly"""
-    strategy = OptionsStrategy("Long Put Butterfly", market_params)
-    strategy.add_option_leg('put', 'long', lower_strike, lower_premium)
-    strategy.add_option_leg('put', 'short', middle_strike, middle_premium)
-    strategy.add_option_leg('put', 'short', middle_strike, middle_premium)
-    strategy.add_option_leg('put', 'long', upper_strike, upper_premium)
-    return strategy
-
-
-def short_call_butterfly(lower_strike: float, middle_strike: float, upper_strike: float,
-                         lower_premium: float, middle_premium: float, upper_premium: float,
-                         market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Short Call Butterfly"""
-    strategy = OptionsStrategy("Short Call Butterfly", market_params)
-    strategy.add_option_leg('call', 'short', lower_strike, lower_premium)
-    strategy.add_option_leg('call', 'long', middle_strike, middle_premium)
-    strategy.add_option_leg('call', 'long', middle_strike, middle_premium)
-    strategy.add_option_leg('call', 'short', upper_strike, upper_premium)
-    return strategy
-
-
-def iron_butterfly(atm_strike: float, lower_strike: float, upper_strike: float,
-                   atm_call_premium: float, atm_put_premium: float,
-                   lower_put_premium: float, upper_call_premium: float,
-                   market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Iron Butterfly"""
-    strategy = OptionsStrategy("Iron Butterfly", market_params)
-    strategy.add_option_leg('call', 'short', atm_strike, atm_call_premium)
-    strategy.add_option_leg('put', 'short', atm_strike, atm_put_premium)
-    strategy.add_option_leg('put', 'long', lower_strike, lower_put_premium)
-    strategy.add_option_leg('call', 'long', upper_strike, upper_call_premium)
-    return strategy
-
-
-# ============================================================================
-# CONDORS (3)
-# ============================================================================
-
-def iron_condor(put_lower: float, put_upper: float, call_lower: float, call_upper: float,
-                put_lower_prem: float, put_upper_prem: float,
-                call_lower_prem: float, call_upper_prem: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Iron Condor"""
-    strategy = OptionsStrategy("Iron Condor", market_params)
-    strategy.add_option_leg('put', 'long', put_lower, put_lower_prem)
-    strategy.add_option_leg('put', 'short', put_upper, put_upper_prem)
-    strategy.add_option_leg('call', 'short', call_lower, call_lower_prem)
-    strategy.add_option_leg('call', 'long', call_upper, call_upper_prem)
-    return strategy
-
-
-def long_call_condor(s1: float, s2: float, s3: float, s4: float,
-                     p1: float, p2: float, p3: float, p4: float,
-                     market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Call Condor"""
-    strategy = OptionsStrategy("Long Call Condor", market_params)
-    strategy.add_option_leg('call', 'long', s1, p1)
-    strategy.add_option_leg('call', 'short', s2, p2)
-    strategy.add_option_leg('call', 'short', s3, p3)
-    strategy.add_option_leg('call', 'long', s4, p4)
-    return strategy
-
-
-def long_put_condor(s1: float, s2: float, s3: float, s4: float,
-                    p1: float, p2: float, p3: float, p4: float,
-                    market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Put Condor"""
-    strategy = OptionsStrategy("Long Put Condor", market_params)
-    strategy.add_option_leg('put', 'long', s1, p1)
-    strategy.add_option_leg('put', 'short', s2, p2)
-    strategy.add_option_leg('put', 'short', s3, p3)
-    strategy.add_option_leg('put', 'long', s4, p4)
-    return strategy
-
-
-# ============================================================================
-# RATIO SPREADS (3)
-# ============================================================================
-
-def call_ratio_spread(lower_strike: float, upper_strike: float,
-                      lower_premium: float, upper_premium: float,
-                      ratio: int = 2,
-                      market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Call Ratio Spread - Long 1 lower + Short N upper"""
-    strategy = OptionsStrategy(f"Call Ratio Spread (1:{ratio})", market_params)
-    strategy.add_option_leg('call', 'long', lower_strike, lower_premium)
-    for _ in range(ratio):
-        strategy.add_option_leg('call', 'short', upper_strike, upper_premium)
-    return strategy
-
-
-def put_ratio_spread(lower_strike: float, upper_strike: float,
-                     lower_premium: float, upper_premium: float,
-                     ratio: int = 2,
-                     market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Put Ratio Spread - Long 1 upper + Short N lower"""
-    strategy = OptionsStrategy(f"Put Ratio Spread (1:{ratio})", market_params)
-    strategy.add_option_leg('put', 'long', upper_strike, upper_premium)
-    for _ in range(ratio):
-        strategy.add_option_leg('put', 'short', lower_strike, lower_premium)
-    return strategy
-
-
-def call_ratio_backspread(lower_strike: float, upper_strike: float,
-                          lower_premium: float, upper_premium: float,
-                          ratio: int = 2,
-                          market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Call Ratio Backspread - Short 1 lower + Long N upper"""
-    strategy = OptionsStrategy(f"Call Ratio Backspread (1:{ratio})", market_params)
-    strategy.add_option_leg('call', 'short', lower_strike, lower_premium)
-    for _ in range(ratio):
-        strategy.add_option_leg('call', 'long', upper_strike, upper_premium)
-    return strategy
-
-
-# ============================================================================
-# CALENDAR & DIAGONAL SPREADS (4)
-# ============================================================================
-
-def call_calendar_spread(strike: float, near_premium: float, far_premium: float,
-                         market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Call Calendar Spread - Sell near, buy far (same strike)"""
-    strategy = OptionsStrategy("Call Calendar Spread", market_params)
-    strategy.add_option_leg('call', 'short', strike, near_premium)
-    strategy.add_option_leg('call', 'long', strike, far_premium)
-    return strategy
-
-
-def put_calendar_spread(strike: float, near_premium: float, far_premium: float,
-                        market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Put Calendar Spread - Sell near, buy far (same strike)"""
-    strategy = OptionsStrategy("Put Calendar Spread", market_params)
-    strategy.add_option_leg('put', 'short', strike, near_premium)
-    strategy.add_option_leg('put', 'long', strike, far_premium)
-    return strategy
-
-
-def diagonal_call_spread(near_strike: float, far_strike: float,
-                         near_premium: float, far_premium: float,
-                         market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Diagonal Call Spread"""
-    strategy = OptionsStrategy("Diagonal Call Spread", market_params)
-    strategy.add_option_leg('call', 'short', near_strike, near_premium)
-    strategy.add_option_leg('call', 'long', far_strike, far_premium)
-    return strategy
-
-
-def diagonal_put_spread(near_strike: float, far_strike: float,
-                        near_premium: float, far_premium: float,
-                        market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Diagonal Put Spread"""
-    strategy = OptionsStrategy("Diagonal Put Spread", market_params)
-    strategy.add_option_leg('put', 'short', near_strike, near_premium)
-    strategy.add_option_leg('put', 'long', far_strike, far_premium)
-    return strategy
+class StrategyBank:
+    """
+    Option legs of many strategies in padded (strategies x legs) arrays
+    (AoSoA), for evaluating a whole batch over one price grid in a single
+    kernel call. The leg axis is padded to a multiple of LANES with zero
+    weight, so padding slots contribute nothing.
+    """
+    
+    LANES = 8  # float32 lanes per AVX2 register
+    
+    def __init__(self, strategies: Sequence[OptionsStrategy]):
+        n_legs = max((len(strategy.strikes) for strategy in strategies), default=0)
+        shape = (len(strategies), n_legs)
+        strikes = np.zeros(shape)
+        premiums = np.zeros(shape)
+        type_sign = np.ones(shape, dtype=np.int8)
+        weight = np.zeros(shape, dtype=np.int32)
+        stock_shares = np.zeros(len(strategies))
+        stock_cost = np.zeros(len(strategies))
+        
+        for k, strategy in enumerate(strategies):
+            n = len(strategy.strikes)
+            strikes[k, :n] = strategy.strikes
+            premiums[k, :n] = strategy.premiums
+            type_sign[k, :n] = strategy._type_sign
+            weight[k, :n] = strategy.sign * strategy.qty
+            for leg in strategy.stock_legs:
+                shares = leg.quantity if leg.position == 'long' else -leg.quantity
+                stock_shares[k] += shares
+                stock_cost[k] += shares * leg.price
+        
+        self._set_legs([strategy.name for strategy in strategies], strikes, premiums,
+                       type_sign, weight, stock_shares, stock_cost)
+    
+    @classmethod
+    def from_arrays(cls, names: List[str], strikes: np.ndarray, premiums: np.ndarray,
+                    type_sign: np.ndarray, weight: np.ndarray,
+                    stock_shares: np.ndarray, stock_cost: np.ndarray) -> 'StrategyBank':
+        """Bank from unpadded (strategies x legs) leg fields and per-strategy stock totals"""
+        bank = cls.__new__(cls)
+        bank._set_legs(names, strikes, premiums, type_sign, weight, stock_shares, stock_cost)
+        return bank
+    
+    def _set_legs(self, names, strikes, premiums, type_sign, weight, stock_shares, stock_cost):
+        """Store the leg fields, padding the leg axis to a multiple of LANES"""
+        n_strategies, n_legs = np.shape(strikes)
+        pad = ((0, 0), (0, max(-(-n_legs // self.LANES) * self.LANES, self.LANES) - n_legs))
+        self.names = names
+        self.strikes = np.pad(np.asarray(strikes, dtype=np.float32), pad)
+        self.premiums = np.pad(np.asarray(premiums, dtype=np.float32), pad)
+        # +1 call, -1 put
+        self.type_sign = np.pad(np.asarray(type_sign, dtype=np.int8), pad, constant_values=1)
+        # sign * contracts, 0 in padding slots
+        self.weight = np.pad(np.asarray(weight, dtype=np.int32), pad)
+        self.stock_shares = np.asarray(stock_shares, dtype=float)  # signed share count
+        self.stock_cost = np.asarray(stock_cost, dtype=float)      # signed shares * entry price
+        # Set by strategy_grid: every strategy is the same template, so the
+        # payoff can use that template's specialized kernel
+        self.template: Optional[str] = None
+        self.template_args: Optional[np.ndarray] = None  # (arguments x strategies)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def payoff_at_expiration(self, S_T: np.ndarray) -> np.ndarray:
+        """Payoff of every strategy at expiration, shape (strategies, prices)"""
+        S_T = np.atleast_1d(_price_grid(S_T))
+        if self.template is not None:
+            return template_payoff_kernel(self.template)(S_T, self.template_args)
+        return bank_payoff_vec(S_T, self.strikes, self.premiums, self.type_sign,
+                               self.weight, self.stock_shares, self.stock_cost)
 
 
 # ============================================================================
-# COLLARS (2)
+# STRATEGY TEMPLATES
 # ============================================================================
 
-def collar(stock_price: float, put_strike: float, call_strike: float,
-          put_premium: float, call_premium: float,
-          market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Collar - Long stock + Long put + Short call"""
-    strategy = OptionsStrategy("Collar", market_params)
-    strategy.add_stock_leg('long', stock_price, 100)
-    strategy.add_option_leg('put', 'long', put_strike, put_premium)
-    strategy.add_option_leg('call', 'short', call_strike, call_premium)
-    return strategy
-
-
-def reverse_collar(stock_price: float, put_strike: float, call_strike: float,
-                   put_premium: float, call_premium: float,
-                   market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Reverse Collar - Short stock + Short put + Long call"""
-    strategy = OptionsStrategy("Reverse Collar", market_params)
-    strategy.add_stock_leg('short', stock_price, 100)
-    strategy.add_option_leg('put', 'short', put_strike, put_premium)
-    strategy.add_option_leg('call', 'long', call_strike, call_premium)
-    return strategy
-
-
-# ============================================================================
-# STRIP & STRAP (4)
-# ============================================================================
+# Every catalog strategy is a fixed recipe of legs whose strikes, premiums
+# and (for ratio spreads) contract counts are taken from the factory
+# arguments by position. build_strategy materializes a recipe with array indexing.
+_STOCK = 2  # template kind for stock legs, next to OptType.PUT/CALL
 
-def long_strip(strike: float, call_premium: float, put_premium: float,
-               market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Strip - 1 call + 2 puts (bearish straddle)"""
-    strategy = OptionsStrategy("Long Strip", market_params)
-    strategy.add_option_leg('call', 'long', strike, call_premium)
-    strategy.add_option_leg('put', 'long', strike, put_premium)
-    strategy.add_option_leg('put', 'long', strike, put_premium)
-    return strategy
+LEG_DTYPE = np.dtype([
+    ('kind', np.int8),        # OptType or _STOCK
+    ('sign', np.int8),        # Side
+    ('strike_idx', np.int8),  # argument holding the strike (stock: entry price)
+    ('prem_idx', np.int8),    # argument holding the premium (-1: stock leg)
+    ('qty', np.int8),         # contracts per leg
+    ('qty_idx', np.int8),     # argument overriding qty (-1: use qty)
+])
 
 
-def long_strap(strike: float, call_premium: float, put_premium: float,
-               market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Long Strap - 2 calls + 1 put (bullish straddle)"""
-    strategy = OptionsStrategy("Long Strap", market_params)
-    strategy.add_option_leg('call', 'long', strike, call_premium)
-    strategy.add_option_leg('call', 'long', strike, call_premium)
-    strategy.add_option_leg('put', 'long', strike, put_premium)
-    return strategy
+def _template(*legs: Tuple[int, int, int, int, int, int]) -> np.ndarray:
+    """Leg recipe as a read-only LEG_DTYPE array"""
+    tpl = np.array(list(legs), dtype=LEG_DTYPE)
+    tpl.flags.writeable = False
+    return tpl
 
 
-def short_strip(strike: float, call_premium: float, put_premium: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Short Strip"""
-    strategy = OptionsStrategy("Short Strip", market_params)
-    strategy.add_option_leg('call', 'short', strike, call_premium)
-    strategy.add_option_leg('put', 'short', strike, put_premium)
-    strategy.add_option_leg('put', 'short', strike, put_premium)
-    return strategy
+def _interned(table: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Table keyed by interned strategy names: names are compared and hashed
+    downstream (catalog lookups, cache keys), so keep one copy of each
+    """
+    return {sys.intern(name): tpl for name, tpl in table.items()}
 
 
-def short_strap(strike: float, call_premium: float, put_premium: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Short Strap"""
-    strategy = OptionsStrategy("Short Strap", market_params)
-    strategy.add_option_leg('call', 'short', strike, call_premium)
-    strategy.add_option_leg('call', 'short', strike, call_premium)
-    strategy.add_option_leg('put', 'short', strike, put_premium)
-    return strategy
-
-
-# ============================================================================
-# ADVANCED STRATEGIES (10+)
-# ============================================================================
-
-def jade_lizard(put_strike: float, call_lower: float, call_upper: float,
-                put_prem: float, call_lower_prem: float, call_upper_prem: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Jade Lizard - Short put + Bear call spread"""
-    strategy = OptionsStrategy("Jade Lizard", market_params)
-    strategy.add_option_leg('put', 'short', put_strike, put_prem)
-    strategy.add_option_leg('call', 'short', call_lower, call_lower_prem)
-    strategy.add_option_leg('call', 'long', call_upper, call_upper_prem)
-    return strategy
-
-
-def seagull(stock_price: float, put_strike: float, call_lower: float, call_upper: float,
-            put_prem: float, call_lower_prem: float, call_upper_prem: float,
-            market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Seagull - Long stock + Long put + Bear call spread"""
-    strategy = OptionsStrategy("Seagull", market_params)
-    strategy.add_stock_leg('long', stock_price, 100)
-    strategy.add_option_leg('put', 'long', put_strike, put_prem)
-    strategy.add_option_leg('call', 'short', call_lower, call_lower_prem)
-    strategy.add_option_leg('call', 'long', call_upper, call_upper_prem)
-    return strategy
-
-
-def box_spread(lower_strike: float, upper_strike: float,
-               call_lower_prem: float, call_upper_prem: float,
-               put_lower_prem: float, put_upper_prem: float,
-               market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Box Spread - Bull call + Bear put"""
-    strategy = OptionsStrategy("Box Spread", market_params)
-    strategy.add_option_leg('call', 'long', lower_strike, call_lower_prem)
-    strategy.add_option_leg('call', 'short', upper_strike, call_upper_prem)
-    strategy.add_option_leg('put', 'long', upper_strike, put_upper_prem)
-    strategy.add_option_leg('put', 'short', lower_strike, put_lower_prem)
-    return strategy
+STRATEGY_TEMPLATES: Dict[str, np.ndarray] = _interned({
+    # Basic (4)
+    "Covered Call": _template(  # stock_price, call_strike, call_premium
+        (_STOCK, Side.LONG, 0, -1, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 2, 1, -1),
+    ),
+    "Covered Put": _template(  # stock_price, put_strike, put_premium
+        (_STOCK, Side.SHORT, 0, -1, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 2, 1, -1),
+    ),
+    "Protective Put": _template(  # stock_price, put_strike, put_premium
+        (_STOCK, Side.LONG, 0, -1, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 2, 1, -1),
+    ),
+    "Protective Call": _template(  # stock_price, call_strike, call_premium
+        (_STOCK, Side.SHORT, 0, -1, 1, -1),
+        (OptType.CALL, Side.LONG, 1, 2, 1, -1),
+    ),
 
+    # Vertical Spreads (4)
+    "Bull Call Spread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 3, 1, -1),
+    ),
+    "Bear Put Spread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium
+        (OptType.PUT, Side.LONG, 1, 3, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 2, 1, -1),
+    ),
+    "Bull Put Spread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium
+        (OptType.PUT, Side.SHORT, 1, 3, 1, -1),
+        (OptType.PUT, Side.LONG, 0, 2, 1, -1),
+    ),
+    "Bear Call Spread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium
+        (OptType.CALL, Side.SHORT, 0, 2, 1, -1),
+        (OptType.CALL, Side.LONG, 1, 3, 1, -1),
+    ),
 
-def conversion(stock_price: float, strike: float, call_prem: float, put_prem: float,
-               market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Conversion - Long stock + Long put + Short call"""
-    strategy = OptionsStrategy("Conversion", market_params)
-    strategy.add_stock_leg('long', stock_price, 100)
-    strategy.add_option_leg('put', 'long', strike, put_prem)
-    strategy.add_option_leg('call', 'short', strike, call_prem)
-    return strategy
+    # Straddles & Strangles (4)
+    "Long Straddle": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.LONG, 0, 1, 1, -1),
+        (OptType.PUT, Side.LONG, 0, 2, 1, -1),
+    ),
+    "Short Straddle": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.SHORT, 0, 1, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 2, 1, -1),
+    ),
+    "Long Strangle": _template(  # call_strike, put_strike, call_premium, put_premium
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 3, 1, -1),
+    ),
+    "Short Strangle": _template(  # call_strike, put_strike, call_premium, put_premium
+        (OptType.CALL, Side.SHORT, 0, 2, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 3, 1, -1),
+    ),
 
+    # Butterflies (4)
+    "Long Call Butterfly": _template(  # lower_strike, middle_strike, upper_strike, lower_premium, middle_premium, upper_premium
+        (OptType.CALL, Side.LONG, 0, 3, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 4, 2, -1),
+        (OptType.CALL, Side.LONG, 2, 5, 1, -1),
+    ),
+    "Long Put Butterfly": _template(  # lower_strike, middle_strike, upper_strike, lower_premium, middle_premium, upper_premium
+        (OptType.PUT, Side.LONG, 0, 3, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 4, 2, -1),
+        (OptType.PUT, Side.LONG, 2, 5, 1, -1),
+    ),
+    "Short Call Butterfly": _template(  # lower_strike, middle_strike, upper_strike, lower_premium, middle_premium, upper_premium
+        (OptType.CALL, Side.SHORT, 0, 3, 1, -1),
+        (OptType.CALL, Side.LONG, 1, 4, 2, -1),
+        (OptType.CALL, Side.SHORT, 2, 5, 1, -1),
+    ),
+    "Iron Butterfly": _template(  # atm_strike, lower_strike, upper_strike, atm_call_premium, atm_put_premium, lower_put_premium, upper_call_premium
+        (OptType.CALL, Side.SHORT, 0, 3, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 4, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 5, 1, -1),
+        (OptType.CALL, Side.LONG, 2, 6, 1, -1),
+    ),
 
-def reversal(stock_price: float, strike: float, call_prem: float, put_prem: float,
-             market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Reversal - Short stock + Short put + Long call"""
-    strategy = OptionsStrategy("Reversal", market_params)
-    strategy.add_stock_leg('short', stock_price, 100)
-    strategy.add_option_leg('put', 'short', strike, put_prem)
-    strategy.add_option_leg('call', 'long', strike, call_prem)
-    return strategy
+    # Condors (3)
+    "Iron Condor": _template(  # put_lower, put_upper, call_lower, call_upper, put_lower_prem, put_upper_prem, call_lower_prem, call_upper_prem
+        (OptType.PUT, Side.LONG, 0, 4, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 5, 1, -1),
+        (OptType.CALL, Side.SHORT, 2, 6, 1, -1),
+        (OptType.CALL, Side.LONG, 3, 7, 1, -1),
+    ),
+    "Long Call Condor": _template(  # s1, s2, s3, s4, p1, p2, p3, p4
+        (OptType.CALL, Side.LONG, 0, 4, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 5, 1, -1),
+        (OptType.CALL, Side.SHORT, 2, 6, 1, -1),
+        (OptType.CALL, Side.LONG, 3, 7, 1, -1),
+    ),
+    "Long Put Condor": _template(  # s1, s2, s3, s4, p1, p2, p3, p4
+        (OptType.PUT, Side.LONG, 0, 4, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 5, 1, -1),
+        (OptType.PUT, Side.SHORT, 2, 6, 1, -1),
+        (OptType.PUT, Side.LONG, 3, 7, 1, -1),
+    ),
 
+    # Ratio Spreads (3)
+    "Call Ratio Spread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium, ratio
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 3, 1, 4),
+    ),
+    "Put Ratio Spread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium, ratio
+        (OptType.PUT, Side.LONG, 1, 3, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 2, 1, 4),
+    ),
+    "Call Ratio Backspread": _template(  # lower_strike, upper_strike, lower_premium, upper_premium, ratio
+        (OptType.CALL, Side.SHORT, 0, 2, 1, -1),
+        (OptType.CALL, Side.LONG, 1, 3, 1, 4),
+    ),
 
-def poor_mans_covered_call(deep_itm_strike: float, otm_strike: float,
-                           deep_itm_prem: float, otm_prem: float,
-                           market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Poor Man's Covered Call - Deep ITM LEAPS + Short OTM call"""
-    strategy = OptionsStrategy("Poor Man's Covered Call", market_params)
-    strategy.add_option_leg('call', 'long', deep_itm_strike, deep_itm_prem)
-    strategy.add_option_leg('call', 'short', otm_strike, otm_prem)
-    return strategy
+    # Calendar & Diagonal (4)
+    "Call Calendar Spread": _template(  # strike, near_premium, far_premium
+        (OptType.CALL, Side.SHORT, 0, 1, 1, -1),
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+    ),
+    "Put Calendar Spread": _template(  # strike, near_premium, far_premium
+        (OptType.PUT, Side.SHORT, 0, 1, 1, -1),
+        (OptType.PUT, Side.LONG, 0, 2, 1, -1),
+    ),
+    "Diagonal Call Spread": _template(  # near_strike, far_strike, near_premium, far_premium
+        (OptType.CALL, Side.SHORT, 0, 2, 1, -1),
+        (OptType.CALL, Side.LONG, 1, 3, 1, -1),
+    ),
+    "Diagonal Put Spread": _template(  # near_strike, far_strike, near_premium, far_premium
+        (OptType.PUT, Side.SHORT, 0, 2, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 3, 1, -1),
+    ),
 
+    # Collars (2)
+    "Collar": _template(  # stock_price, put_strike, call_strike, put_premium, call_premium
+        (_STOCK, Side.LONG, 0, -1, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 3, 1, -1),
+        (OptType.CALL, Side.SHORT, 2, 4, 1, -1),
+    ),
+    "Reverse Collar": _template(  # stock_price, put_strike, call_strike, put_premium, call_premium
+        (_STOCK, Side.SHORT, 0, -1, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 3, 1, -1),
+        (OptType.CALL, Side.LONG, 2, 4, 1, -1),
+    ),
 
-def wheel_put_phase(put_strike: float, put_premium: float,
-                    market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Wheel Strategy - Put Phase (cash-secured put)"""
-    strategy = OptionsStrategy("Wheel Strategy (Put)", market_params)
-    strategy.add_option_leg('put', 'short', put_strike, put_premium)
-    return strategy
+    # Strip & Strap (4)
+    "Long Strip": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.LONG, 0, 1, 1, -1),
+        (OptType.PUT, Side.LONG, 0, 2, 2, -1),
+    ),
+    "Long Strap": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.LONG, 0, 1, 2, -1),
+        (OptType.PUT, Side.LONG, 0, 2, 1, -1),
+    ),
+    "Short Strip": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.SHORT, 0, 1, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 2, 2, -1),
+    ),
+    "Short Strap": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.SHORT, 0, 1, 2, -1),
+        (OptType.PUT, Side.SHORT, 0, 2, 1, -1),
+    ),
 
+    # Advanced (10)
+    "Jade Lizard": _template(  # put_strike, call_lower, call_upper, put_prem, call_lower_prem, call_upper_prem
+        (OptType.PUT, Side.SHORT, 0, 3, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 4, 1, -1),
+        (OptType.CALL, Side.LONG, 2, 5, 1, -1),
+    ),
+    "Seagull": _template(  # stock_price, put_strike, call_lower, call_upper, put_prem, call_lower_prem, call_upper_prem
+        (_STOCK, Side.LONG, 0, -1, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 4, 1, -1),
+        (OptType.CALL, Side.SHORT, 2, 5, 1, -1),
+        (OptType.CALL, Side.LONG, 3, 6, 1, -1),
+    ),
+    "Box Spread": _template(  # lower_strike, upper_strike, call_lower_prem, call_upper_prem, put_lower_prem, put_upper_prem
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 3, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 5, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 4, 1, -1),
+    ),
+    "Conversion": _template(  # stock_price, strike, call_prem, put_prem
+        (_STOCK, Side.LONG, 0, -1, 1, -1),
+        (OptType.PUT, Side.LONG, 1, 3, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 2, 1, -1),
+    ),
+    "Reversal": _template(  # stock_price, strike, call_prem, put_prem
+        (_STOCK, Side.SHORT, 0, -1, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 3, 1, -1),
+        (OptType.CALL, Side.LONG, 1, 2, 1, -1),
+    ),
+    "Poor Man's Covered Call": _template(  # deep_itm_strike, otm_strike, deep_itm_prem, otm_prem
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 3, 1, -1),
+    ),
+    "Wheel Strategy (Put)": _template(  # put_strike, put_premium
+        (OptType.PUT, Side.SHORT, 0, 1, 1, -1),
+    ),
+    "Wheel Strategy (Call)": _template(  # stock_price, call_strike, call_premium
+        (_STOCK, Side.LONG, 0, -1, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 2, 1, -1),
+    ),
+    "ZEBRA Spread": _template(  # deep_itm_strike, otm_strike, deep_itm_prem, otm_prem
+        (OptType.CALL, Side.LONG, 0, 2, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 3, 2, -1),
+    ),
+    "Call Ladder": _template(  # s1, s2, s3, p1, p2, p3
+        (OptType.CALL, Side.LONG, 0, 3, 1, -1),
+        (OptType.CALL, Side.SHORT, 1, 4, 1, -1),
+        (OptType.CALL, Side.SHORT, 2, 5, 1, -1),
+    ),
+    "Put Ladder": _template(  # s1, s2, s3, p1, p2, p3
+        (OptType.PUT, Side.LONG, 2, 5, 1, -1),
+        (OptType.PUT, Side.SHORT, 1, 4, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 3, 1, -1),
+    ),
 
-def wheel_call_phase(stock_price: float, call_strike: float, call_premium: float,
-                     market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Wheel Strategy - Call Phase (covered call after assignment)"""
-    strategy = OptionsStrategy("Wheel Strategy (Call)", market_params)
-    strategy.add_stock_leg('long', stock_price, 100)
-    strategy.add_option_leg('call', 'short', call_strike, call_premium)
-    return strategy
+    # Synthetic (2)
+    "Synthetic Long Stock": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.LONG, 0, 1, 1, -1),
+        (OptType.PUT, Side.SHORT, 0, 2, 1, -1),
+    ),
+    "Synthetic Short Stock": _template(  # strike, call_premium, put_premium
+        (OptType.CALL, Side.SHORT, 0, 1, 1, -1),
+        (OptType.PUT, Side.LONG, 0, 2, 1, -1),
+    ),
+})
+
+
+# Templates whose legs cancel out at expiration (put-call parity): the
+# payoff is a fixed cash amount, so payoff_at_expiration skips the grid.
+CONSTANT_PAYOFFS: Dict[str, Callable[..., float]] = {
+    # lower_strike, upper_strike, call_lower_prem, call_upper_prem, put_lower_prem, put_upper_prem
+    "Box Spread": lambda k1, k2, cl, cu, pl, pu: (k2 - k1 - cl + cu - pu + pl) * 100,
+    # stock_price, strike, call_prem, put_prem
+    "Conversion": lambda s, k, cp, pp: (k - s + cp - pp) * 100,
+    "Reversal": lambda s, k, cp, pp: (s - k - cp + pp) * 100,
+}
 
 
-def zebra_spread(deep_itm_strike: float, otm_strike: float,
-                deep_itm_prem: float, otm_prem: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """ZEBRA - Long 1 deep ITM call + Short 2 OTM calls"""
-    strategy = OptionsStrategy("ZEBRA Spread", market_params)
-    strategy.add_option_leg('call', 'long', deep_itm_strike, deep_itm_prem)
-    strategy.add_option_leg('call', 'short', otm_strike, otm_prem)
-    strategy.add_option_leg('call', 'short', otm_strike, otm_prem)
-    return strategy
+# Display names of ratio strategies, pre-built for the common ratios
+_RATIO_NAME_CACHE: Dict[Tuple[str, int], str] = {
+    (name, ratio): sys.intern(f"{name} (1:{ratio})")
+    for name, tpl in STRATEGY_TEMPLATES.items() if (tpl['qty_idx'] >= 0).any()
+    for ratio in (2, 3)
+}
 
 
-def call_ladder(s1: float, s2: float, s3: float,
-                p1: float, p2: float, p3: float,
-                market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Call Ladder - Long 1 low + Short 1 mid + Short 1 high"""
-    strategy = OptionsStrategy("Call Ladder", market_params)
-    strategy.add_option_leg('call', 'long', s1, p1)
-    strategy.add_option_leg('call', 'short', s2, p2)
-    strategy.add_option_leg('call', 'short', s3, p3)
-    return strategy
+def _ratio_name(name: str, ratio: int) -> str:
+    """Interned display name of a ratio strategy, e.g. Call Ratio Spread (1:2)"""
+    return _RATIO_NAME_CACHE.get((name, ratio)) or sys.intern(f"{name} (1:{ratio})")
+
+
+class TemplateLayout(NamedTuple):
+    """A template's recipe split up once at import for build_strategy/strategy_grid"""
+    n_args: int                # factory arguments the template reads
+    options: np.ndarray        # option legs of the recipe
+    stocks: np.ndarray         # stock legs of the recipe
+    is_call: np.ndarray        # option leg columns, shared read-only
+    sign: np.ndarray
+    type_sign: np.ndarray
+    qty: np.ndarray            # contracts (ratio legs are filled in per build)
+    has_ratio: bool            # some leg takes its contracts from an argument
+
+
+def _readonly(a: np.ndarray) -> np.ndarray:
+    """Contiguous read-only copy"""
+    a = np.array(a)
+    a.flags.writeable = False
+    return a
+
+
+def _layout(tpl: np.ndarray) -> TemplateLayout:
+    """Split a leg recipe into the pieces the builders index"""
+    options = tpl[tpl['kind'] != _STOCK]
+    is_call = options['kind'] == OptType.CALL
+    return TemplateLayout(
+        n_args=int(max(tpl['strike_idx'].max(), tpl['prem_idx'].max(), tpl['qty_idx'].max())) + 1,
+        options=_readonly(options),
+        stocks=_readonly(tpl[tpl['kind'] == _STOCK]),
+        is_call=_readonly(is_call),
+        sign=_readonly(options['sign']),
+        type_sign=_readonly(np.where(is_call, 1, -1).astype(np.int8)),
+        qty=_readonly(options['qty'].astype(np.int32)),
+        has_ratio=bool((options['qty_idx'] >= 0).any()),
+    )
+
+
+TEMPLATE_LAYOUTS: Dict[str, TemplateLayout] = {
+    name: _layout(tpl) for name, tpl in STRATEGY_TEMPLATES.items()
+}
 
 
-def put_ladder(s1: float, s2: float, s3: float,
-               p1: float, p2: float, p3: float,
-               market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Put Ladder - Long 1 high + Short 1 mid + Short 1 low"""
-    strategy = OptionsStrategy("Put Ladder", market_params)
-    strategy.add_option_leg('put', 'long', s3, p3)
-    strategy.add_option_leg('put', 'short', s2, p2)
-    strategy.add_option_leg('put', 'short', s1, p1)
+LEG_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=LEG_CACHE_SIZE)
+def _template_legs(name: str, args: Tuple[float, ...]) -> OptionsStrategy:
+    """
+    Legs of a catalog strategy, built once per (name, args). The returned
+    prototype is shared: build_strategy hands its exactly-sized leg columns
+    to a fresh OptionsStrategy, so adding legs to the copy reallocates
+    rather than writing into the cache.
+    """
+    layout = TEMPLATE_LAYOUTS[name]
+    values = np.asarray(args, dtype=float)
+
+    options = layout.options
+    quantities = layout.qty
+    display_name = name
+    if layout.has_ratio:
+        quantities = np.where(options['qty_idx'] < 0, options['qty'],
+                              values[options['qty_idx']].astype(int)).astype(np.int32)
+        ratio = int(values[options['qty_idx'].max()])
+        display_name = _ratio_name(name, ratio)
+
+    strategy = OptionsStrategy(display_name, legs=(
+        values[options['strike_idx']].astype(LEG_FLOAT_DTYPE),
+        values[options['prem_idx']].astype(LEG_FLOAT_DTYPE),
+        layout.is_call, layout.sign, quantities, layout.type_sign
+    ))
+    # Recipes never repeat a leg, but equal strike arguments can
+    if strategy._has_duplicate_legs():
+        strategy._canonicalize()
+    add_stock_leg = strategy.add_stock_leg
+    for leg in layout.stocks:
+        add_stock_leg('long' if leg['sign'] == Side.LONG else 'short',
+                      float(values[leg['strike_idx']]), 100)
+    if name in CONSTANT_PAYOFFS:
+        strategy.constant_payoff = CONSTANT_PAYOFFS[name](*args)
+    # Every strategy built from this prototype shares these columns
+    for column in (strategy.strikes, strategy.premiums, strategy.is_call,
+                   strategy.sign, strategy.qty, strategy._type_sign):
+        column.flags.writeable = False
     return strategy
 
 
-# ============================================================================
-# SYNTHETIC POSITIONS (2)
-# ============================================================================
-
-def synthetic_long(strike: float, call_premium: float, put_premium: float,
-                   market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Synthetic Long Stock - Long call + Short put"""
-    strategy = OptionsStrategy("Synthetic Long Stock", market_params)
-    strategy.add_option_leg('call', 'long', strike, call_premium)
-    strategy.add_option_leg('put', 'short', strike, put_premium)
+def build_strategy(name: str, *args: float,
+                   market_params: MarketParams = DEFAULT_MARKET_PARAMS) -> OptionsStrategy:
+    """
+    Build a catalog strategy from its template. args are the factory's
+    arguments in order (without market_params); repeated builds with the
+    same arguments (UI refreshes, sweeps) hit the leg cache.
+    """
+    n_args = TEMPLATE_LAYOUTS[name].n_args
+    if len(args) != n_args:
+        raise TypeError(f"{name} takes {n_args} arguments ({len(args)} given)")
+    # Plain floats: hashable cache keys (0-d arrays are not), and NumPy or
+    # int variants of the same argument share one entry
+    proto = _template_legs(name, tuple(float(x) for x in args))
+
+    # Share the prototype's columns, sized exactly: a later add reallocates
+    # instead of writing into the cached buffers.
+    strategy = OptionsStrategy(proto.name, market_params, proto.constant_payoff,
+                               legs=(proto.strikes, proto.premiums, proto.is_call,
+                                     proto.sign, proto.qty, proto._type_sign))
+    strategy.stock_legs = list(proto.stock_legs)  # StockLeg is frozen, safe to share
     return strategy
 
 
-def synthetic_short(strike: float, call_premium: float, put_premium: float,
-                    market_params: Optional[MarketParams] = None) -> OptionsStrategy:
-    """Synthetic Short Stock - Short call + Long put"""
-    strategy = OptionsStrategy("Synthetic Short Stock", market_params)
-    strategy.add_option_leg('call', 'short', strike, call_premium)
-    strategy.add_option_leg('put', 'long', strike, put_premium)
-    return strategy
+def strategy_grid(name: str, *args: Any) -> StrategyBank:
+    """
+    Build a catalog strategy for every combination of its arguments, for
+    parameter sweeps. args are scalars or arrays in factory order and are
+    broadcast together; the bank holds one strategy per element of the
+    broadcast shape, flattened in C order.
+    """
+    layout = TEMPLATE_LAYOUTS[name]
+    n_args = layout.n_args
+    if len(args) != n_args:
+        raise TypeError(f"{name} takes {n_args} arguments ({len(args)} given)")
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in args))
+    values = np.stack([a.ravel() for a in arrays])  # (args, strategies)
+    n_strategies = values.shape[1]
+    
+    options = layout.options
+    stocks = layout.stocks
+    quantities = np.where(options['qty_idx'][:, None] < 0, options['qty'][:, None],
+                          values[options['qty_idx']].astype(int))
+    type_sign = layout.type_sign
+    shares = stocks['sign'].astype(float) * 100
+    
+    if layout.has_ratio:
+        # Named per strategy like build_strategy, e.g. "Call Ratio Spread (1:2)"
+        ratios = values[options['qty_idx'].max()].astype(int).tolist()
+        names = [_ratio_name(name, ratio) for ratio in ratios]
+    else:
+        names = [name] * n_strategies
+    bank = StrategyBank.from_arrays(
+        names,
+        values[options['strike_idx']].T,
+        values[options['prem_idx']].T,
+        np.broadcast_to(type_sign, (n_strategies, len(options))),
+        (options['sign'][:, None] * quantities).T,
+        np.full(n_strategies, shares.sum()),
+        shares @ values[stocks['strike_idx']]
+    )
+    bank.template = name
+    bank.template_args = values
+    return bank
+
+
+def _payoff_source(tpl: np.ndarray) -> str:
+    """Source of a payoff kernel with the template's legs unrolled into one expression"""
+    expr = ""
+    for leg in tpl:
+        strike = f"a[{leg['strike_idx']}, j]"
+        if leg['kind'] == _STOCK:
+            # 100 shares: the x100 below covers the share count
+            term = f"(s - {strike})"
+        else:
+            if leg['kind'] == OptType.CALL:
+                term = f"(max(s - {strike}, 0.0) - a[{leg['prem_idx']}, j])"
+            else:
+                term = f"(max({strike} - s, 0.0) - a[{leg['prem_idx']}, j])"
+            if leg['qty_idx'] >= 0:
+                # Whole contracts, truncated like strategy_grid/_template_legs
+                term = f"float(int(a[{leg['qty_idx']}, j])) * {term}"
+            elif leg['qty'] != 1:
+                term = f"{leg['qty']}.0 * {term}"
+        if expr:
+            expr += "\n                                 " + ("+ " if leg['sign'] > 0 else "- ")
+        elif leg['sign'] < 0:
+            expr = "-"
+        expr += term
+    return (
+        "def payoff(S, a):\n"
+        "    out = np.empty((a.shape[1], S.shape[0]), dtype=S.dtype)\n"
+        "    for j in range(a.shape[1]):\n"
+        "        for i in range(S.shape[0]):\n"
+        "            s = S[i]\n"
+        "            out[j, i] = 100.0 * (" + expr + ")\n"
+        "    return out\n"
+    )
+
+
+@lru_cache(maxsize=None)
+def template_payoff_kernel(name: str) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Expiration payoff kernel specialized to one template: the leg loop is
+    unrolled at codegen time into a straight-line expression, generated
+    with exec and compiled on first use. Called as kernel(S, args) with
+    args shaped (template arguments x strategies); returns
+    (strategies x prices).
+    
+    Numba cannot disk-cache exec'd functions, so each template compiles
+    once per process; StrategyBank only uses these for strategy_grid
+    sweeps, where that cost is amortized.
+    """
+    namespace = {'np': np}
+    exec(compile(_payoff_source(STRATEGY_TEMPLATES[name]), f"<{name} payoff>", "exec"), namespace)
+    return njit(fastmath=True)(namespace['payoff'])
 
 
 # ============================================================================
-# STRATEGY CATALOG
+# STRATEGY FACTORIES (lazy)
 # ============================================================================
 
-ALL_STRATEGIES = {
-    # Basic (4)
-    "Covered Call": covered_call,
-    "Covered Put": covered_put,
-    "Protective Put": protective_put,
-    "Protective Call": protective_call,
-    
-    # Vertical Spreads (4)
-    "Bull Call Spread": bull_call_spread,
-    "Bear Put Spread": bear_put_spread,
-    "Bull Put Spread": bull_put_spread,
-    "Bear Call Spread": bear_call_spread,
-    
-    # Straddles & Strangles (4)
-    "Long Straddle": long_straddle,
-    "Short Straddle": short_straddle,
-    "Long Strangle": long_strangle,
-    "Short Strangle": short_strangle,
-    
-    # Butterflies (4)
-    "Long Call Butterfly": long_call_butterfly,
-    "Long Put Butterfly": long_put_butterfly,
-    "Short Call Butterfly": short_call_butterfly,
-    "Iron Butterfly": iron_butterfly,
-    
-    # Condors (3)
-    "Iron Condor": iron_condor,
-    "Long Call Condor": long_call_condor,
-    "Long Put Condor": long_put_condor,
-    
-    # Ratio Spreads (3)
-    "Call Ratio Spread": call_ratio_spread,
-    "Put Ratio Spread": put_ratio_spread,
-    "Call Ratio Backspread": call_ratio_backspread,
-    
-    # Calendar & Diagonal (4)
-    "Call Calendar Spread": call_calendar_spread,
-    "Put Calendar Spread": put_calendar_spread,
-    "Diagonal Call Spread": diagonal_call_spread,
-    "Diagonal Put Spread": diagonal_put_spread,
-    
-    # Collars (2)
-    "Collar": collar,
-    "Reverse Collar": reverse_collar,
-    
-    # Strip & Strap (4)
-    "Long Strip": long_strip,
-    "Long Strap": long_strap,
-    "Short Strip": short_strip,
-    "Short Strap": short_strap,
-    
-    # Advanced (10)
-    "Jade Lizard": jade_lizard,
-    "Seagull": seagull,
-    "Box Spread": box_spread,
-    "Conversion": conversion,
-    "Reversal": reversal,
-    "Poor Man's Covered Call": poor_mans_covered_call,
-    "Wheel Strategy (Put)": wheel_put_phase,
-    "Wheel Strategy (Call)": wheel_call_phase,
-    "ZEBRA Spread": zebra_spread,
-    "Call Ladder": call_ladder,
-    "Put Ladder": put_ladder,
-    
-    # Synthetic (2)
-    "Synthetic Long Stock": synthetic_long,
-    "Synthetic Short Stock": synthetic_short,
-}
-
-# Total: 50+ strategies
+def __getattr__(name: str):
+    """
+    PEP 562 hook: the ~50 factory functions, ALL_STRATEGIES and
+    make_factories live in _strategies_impl and are only imported the
+    first time one of them is looked up here, keeping them out of cold
+    starts that only need the core classes.
+    """
+    if not name.startswith('_'):
+        import _strategies_impl
+        if name in _strategies_impl.__all__:
+            value = getattr(_strategies_impl, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")